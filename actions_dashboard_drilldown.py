@@ -2,112 +2,239 @@
 Actions Dashboard avec drill-down par pilier - Version corrigée
 """
 
+import html
 import streamlit as st
-import json
-import pandas as pd
+from bisect import bisect_right
+from functools import lru_cache
+from utils.data_loader import get_actions, get_checklist, reload as reload_data
 
-def load_actions_dashboard_data():
-    """Charge les données du Dashboard Actions"""
-    try:
-        with open('actions_dashboard_data.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        st.error("Fichier de données du Dashboard Actions non trouvé")
-        return {}
-    except json.JSONDecodeError:
-        st.error("Erreur de format dans le fichier JSON")
-        return {}
+STATUS_ICON = {"done": "✅", "in_progress": "🔄", "todo": "⏳"}
+STATUS_LABEL = {"done": "✅ Terminée", "in_progress": "🔄 En cours", "todo": "⏳ À faire"}
+STATUS_COLOR = {"done": "#28a745", "in_progress": "#ffc107", "todo": "#6c757d"}
+PRIORITY_ICON = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+PRIORITY_LABEL = {"high": "High", "medium": "Medium", "low": "Low"}
+PROGRESS = {"done": 100, "high": 60, "medium": 30, "low": 10}
 
-def load_checklist_data():
-    """Charge les données de checklist depuis le fichier JSON"""
-    try:
-        with open('checklist_data.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        st.error("Fichier checklist_data.json non trouvé")
-        return {}
-    except json.JSONDecodeError:
-        st.error("Erreur de format dans checklist_data.json")
-        return {}
+# Filtres de statut du popup : libellé -> statuts normalisés acceptés (None = tous)
+STATUS_FILTERS = {
+    "Tous": None,
+    "À faire": ("in_progress", "todo"),
+    "En cours": ("in_progress",),
+    "Terminées": ("done",),
+}
 
-def create_pillar_card(pillar_id, pillar_data, pillar_tasks):
-    """Crée une carte cliquable pour un pilier"""
-    
-    completion = pillar_data["completion_percentage"]
-    
-    # Déterminer la couleur selon le pourcentage
-    if completion >= 75:
-        color = "#28a745"
-        status_icon = "🟢"
-    elif completion >= 50:
-        color = "#ffc107" 
-        status_icon = "🟡"
-    elif completion >= 25:
-        color = "#fd7e14"
-        status_icon = "🟠"
-    else:
-        color = "#dc3545"
-        status_icon = "🔴"
-    
-    # Compter les tâches par statut
-    total_tasks = len(pillar_tasks)
-    completed_tasks = len([t for t in pillar_tasks if t.get("completed", False)])
-    in_progress_tasks = len([t for t in pillar_tasks if not t.get("completed", False) and t.get("priority") in ["high", "medium"]])
-    todo_tasks = total_tasks - completed_tasks - in_progress_tasks
-    
-    # Style de la carte avec meilleure lisibilité
-    card_style = f"""
-    <div style="
-        border: 2px solid {color};
-        border-radius: 12px;
-        padding: 20px;
-        margin: 10px 0;
-        background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        transition: all 0.3s ease;
-        cursor: pointer;
-        position: relative;
-    ">
-        <div style="display: flex; align-items: center; margin-bottom: 15px;">
-            <span style="font-size: 2rem; margin-right: 15px;">{pillar_data['icon']}</span>
-            <div>
-                <h3 style="margin: 0; color: #2c3e50; font-size: 1.2rem; font-weight: 600;">
-                    {pillar_data['name']}
-                </h3>
-                <p style="margin: 5px 0 0 0; color: #6c757d; font-size: 0.9rem;">
-                    {status_icon} {completion:.1f}% complété
-                </p>
-            </div>
-        </div>
-        
-        <div style="margin-bottom: 15px;">
-            <div style="background-color: #e9ecef; border-radius: 10px; height: 8px; overflow: hidden;">
-                <div style="
-                    background-color: {color}; 
-                    height: 100%; 
-                    width: {completion}%; 
-                    transition: width 0.3s ease;
-                "></div>
-            </div>
+_PILLAR_KEYS = tuple(f"pillar_{idx}" for idx in range(1, 7))
+
+# Couleur et icône d'un pilier par tranche de 25% de complétion
+_PILLAR_COLORS = (("#dc3545", "🔴"), ("#fd7e14", "🟠"), ("#ffc107", "🟡"), ("#28a745", "🟢"))
+
+# Message de statut global par seuil de complétion (< 30%, < 70%, au-delà)
+_PROGRESS_THRESHOLDS = (30, 70)
+_PROGRESS_MESSAGES = (
+    ("#dc3545", "⚠️ Progrès modéré. Accélérer la mise en œuvre des actions prioritaires."),
+    ("#ffc107", "🔄 Progression satisfaisante. Maintenir l'effort sur les piliers critiques."),
+    ("#28a745", "✅ Excellente progression. Framework CRO bien avancé."),
+)
+
+# Carte d'un pilier, sans ligne vide pour rester un seul bloc HTML
+_CARD_TEMPLATE = """<div style="
+    border: 2px solid {color};
+    border-radius: 12px;
+    padding: 20px;
+    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    transition: all 0.3s ease;
+    position: relative;
+">
+    <div style="display: flex; align-items: center; margin-bottom: 15px;">
+        <span style="font-size: 2rem; margin-right: 15px;">{icon}</span>
+        <div>
+            <h3 style="margin: 0; color: #2c3e50; font-size: 1.2rem; font-weight: 600;">{name}</h3>
+            <p style="margin: 5px 0 0 0; color: #6c757d; font-size: 0.9rem;">{status_icon} {completion:.1f}% complété</p>
         </div>
-        
-        <div style="display: flex; justify-content: space-between; font-size: 0.85rem; color: #495057;">
-            <span>✅ {completed_tasks}</span>
-            <span>🔄 {in_progress_tasks}</span>
-            <span>⏳ {todo_tasks}</span>
+    </div>
+    <div style="margin-bottom: 15px;">
+        <div style="background-color: #e9ecef; border-radius: 10px; height: 8px; overflow: hidden;">
+            <div style="background-color: {color}; height: 100%; width: {completion}%; transition: width 0.3s ease;"></div>
         </div>
     </div>
-    """
+    <div style="display: flex; justify-content: space-between; font-size: 0.85rem; color: #495057;">
+        <span>✅ {completed}</span>
+        <span>🔄 {in_progress}</span>
+        <span>⏳ {todo}</span>
+    </div>
+</div>"""
+
+# Carte d'une action prioritaire
+_PRIORITY_CARD_TEMPLATE = """<div style="
+    border-left: 4px solid #dc3545;
+    padding: 15px;
+    margin: 10px 0;
+    background: linear-gradient(135deg, #fff5f5 0%, #ffffff 100%);
+    border-radius: 0 8px 8px 0;
+    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+">
+    <h4 style="color: #dc3545; margin: 0 0 10px 0; font-weight: 600;">🔥 Priorité {rank}: {task}</h4>
+    <p style="margin: 5px 0; color: #495057;"><strong>Pilier:</strong> {pillar_title}</p>
+    <p style="margin: 5px 0; color: #495057;"><strong>Responsable:</strong> {responsible}</p>
+    <p style="margin: 5px 0; color: #6c757d; font-size: 0.9rem;">{description}</p>
+</div>"""
+
+# Au-delà de ce nombre de tâches, le popup rend des blocs <details> HTML plutôt que des expanders
+_DETAILS_THRESHOLD = 15
+
+# Détail d'une tâche en bloc <details> natif (dépliable sans aller-retour serveur)
+_TASK_DETAILS_TEMPLATE = """<details style="border: 1px solid #e9ecef; border-radius: 8px; padding: 10px 15px; margin: 8px 0;">
+<summary style="cursor: pointer; font-weight: 600;">{status_icon} {task}</summary>
+<div style="display: flex; gap: 20px; margin-top: 10px;">
+<div style="flex: 3;">
+<p><strong>Description:</strong><br>{description}</p>
+<p><strong>Responsable:</strong><br>{responsible}</p>{deliverables}
+</div>
+<div style="flex: 1;">
+<p><strong>Statut:</strong><br><span style="color: {status_color}; font-weight: bold;">{status_label}</span></p>
+<p><strong>Priorité:</strong><br>{prio_icon} {prio_label}</p>
+<p><strong>Progression:</strong><br>{progress}%</p>
+<div style="background-color: #e9ecef; border-radius: 10px; height: 8px; overflow: hidden;"><div style="background-color: {status_color}; height: 100%; width: {progress}%;"></div></div>
+</div>
+</div>
+</details>"""
+
+def _html_text(value):
+    """Texte échappé pour le bloc HTML, retours à la ligne en <br> (une ligne vide fermerait le bloc)"""
+    return html.escape(str(value)).replace("\n", "<br>")
+
+def build_task_details_html(task):
+    """Construit le bloc <details> HTML d'une tâche"""
+    
+    status = task["status"]
+    deliverables = ""
+    if task.get("deliverables"):
+        items = "".join(f"<li>{_html_text(deliverable)}</li>" for deliverable in task["deliverables"])
+        deliverables = f"<p><strong>Livrables attendus:</strong></p><ul>{items}</ul>"
+    ctx = {
+        "status_icon": STATUS_ICON[status],
+        "task": _html_text(task.get("task", "Tâche sans titre")),
+        "description": _html_text(task.get("description", "Pas de description disponible")),
+        "responsible": _html_text(task.get("responsible", "Non assigné")),
+        "deliverables": deliverables,
+        "status_color": STATUS_COLOR[status],
+        "status_label": STATUS_LABEL[status],
+        "prio_icon": task["_prio_icon"],
+        "prio_label": task["_prio_label"],
+        "progress": task["progress"],
+    }
+    return _TASK_DETAILS_TEMPLATE.format_map(ctx)
+
+def normalize_checklist(checklist_data):
+    """Ajoute à chaque tâche un statut normalisé et une progression estimée"""
+    
+    normalized = {}
+    for pillar_id, pillar_data in checklist_data.items():
+        tasks = []
+        for task in pillar_data.get("tasks", []):
+            task = dict(task)
+            priority = task.get("priority", "low")
+            task["_prio_icon"] = PRIORITY_ICON.get(priority, "⚪")
+            task["_prio_label"] = PRIORITY_LABEL.get(priority) or str(priority).title()
+            description = task.get("description") or "Pas de description"
+            task["_desc_preview"] = description[:200] + ("…" if len(description) > 200 else "")
+            task["_deliverables_md"] = "\n".join(f"- {deliverable}" for deliverable in task.get("deliverables") or ())
+            if task.get("completed", False):
+                task["status"] = "done"
+                task["progress"] = PROGRESS["done"]
+            else:
+                task["status"] = "in_progress" if priority in ("high", "medium") else "todo"
+                task["progress"] = PROGRESS.get(priority, PROGRESS["low"])
+            tasks.append(task)
+        normalized[pillar_id] = {**pillar_data, "tasks": tasks}
+    return normalized
+
+def compute_pillar_stats(checklist_data):
+    """Agrège en une seule passe les compteurs de tâches de chaque pilier"""
+    
+    stats = {}
+    for pillar_id, pillar_data in checklist_data.items():
+        counts = {"done": 0, "in_progress": 0, "todo": 0}
+        for task in pillar_data.get("tasks", []):
+            counts[task["status"]] += 1
+        stats[pillar_id] = {
+            "completed": counts["done"],
+            "in_progress": counts["in_progress"],
+            "todo": counts["todo"],
+        }
+    return stats
+
+_EMPTY_PILLAR_STATS = {"completed": 0, "in_progress": 0, "todo": 0}
+
+def find_top_priority_tasks(checklist_data, limit=3):
+    """Retourne les premières tâches non terminées de priorité haute (arrêt dès la limite)"""
     
-    st.markdown(card_style, unsafe_allow_html=True)
+    top_tasks = []
+    for pillar_id, pillar_data in checklist_data.items():
+        for task in pillar_data.get("tasks", ()):
+            if task["status"] != "done" and task.get("priority") == "high":
+                top_tasks.append((pillar_id, pillar_data.get("title", ""), task))
+                if len(top_tasks) == limit:
+                    return tuple(top_tasks)
+    return tuple(top_tasks)
+
+@st.cache_data(show_spinner=False)
+def build_view_model(checklist_data):
+    """Normalise la checklist et précalcule tout ce que la page affiche"""
+    
+    checklist_data = normalize_checklist(checklist_data)
+    return {
+        "pillar_stats": compute_pillar_stats(checklist_data),
+        "pillar_tasks": {
+            pillar_id: tuple(pillar_data["tasks"])
+            for pillar_id, pillar_data in checklist_data.items()
+        },
+        "top3": find_top_priority_tasks(checklist_data),
+    }
+
+@lru_cache(maxsize=64)
+def _build_card_html(name, icon, completion, completed, in_progress, todo):
+    """HTML d'une carte pilier, mémorisé sur ses valeurs affichées"""
     
-    # Bouton pour ouvrir le popup
-    button_key = f"btn_{pillar_id}"
-    if st.button(f"Voir les actions", key=button_key, help=f"Cliquer pour voir les actions du pilier {pillar_data['name']}"):
-        show_pillar_actions_popup(pillar_id, pillar_data, pillar_tasks)
+    # Déterminer la couleur selon le pourcentage
+    color, status_icon = _PILLAR_COLORS[min(max(int(completion), 0) // 25, 3)]
+    
+    ctx = {
+        "color": color,
+        "status_icon": status_icon,
+        "completion": completion,
+        "icon": icon,
+        "name": name,
+        "completed": completed,
+        "in_progress": in_progress,
+        "todo": todo,
+    }
+    return _CARD_TEMPLATE.format_map(ctx)
+
+def create_pillar_card(pillar_data, pillar_stats):
+    """Construit le HTML de la carte d'un pilier"""
+    
+    return _build_card_html(
+        pillar_data["name"],
+        pillar_data["icon"],
+        pillar_data["completion_percentage"],
+        pillar_stats["completed"],
+        pillar_stats["in_progress"],
+        pillar_stats["todo"],
+    )
+
+def render_pillar_grid_html(pillars, pillar_stats):
+    """Assemble les cartes des piliers dans une seule grille HTML 3 colonnes"""
+    
+    cards = "\n".join(
+        create_pillar_card(pillar_data, pillar_stats.get(pillar_key, _EMPTY_PILLAR_STATS))
+        for pillar_key, pillar_data in pillars
+    )
+    return f'<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px; margin: 10px 0;">\n{cards}\n</div>'
 
 @st.dialog("Actions du Pilier")
-def show_pillar_actions_popup(pillar_id, pillar_data, tasks):
+def show_pillar_actions_popup(pillar_id, pillar_data, tasks, pillar_stats):
     """Affiche le popup avec les actions détaillées du pilier"""
     
     st.markdown(f"## {pillar_data['icon']} {pillar_data['name']}")
@@ -124,7 +251,7 @@ def show_pillar_actions_popup(pillar_id, pillar_data, tasks):
     with col1:
         status_filter = st.selectbox(
             "📊 Statut",
-            ["Tous", "À faire", "En cours", "Terminées"],
+            list(STATUS_FILTERS),
             index=0,
             key=f"popup_status_{pillar_id}"
         )
@@ -139,19 +266,14 @@ def show_pillar_actions_popup(pillar_id, pillar_data, tasks):
     
     st.markdown("---")
     
-    # Filtrer les tâches
-    filtered_tasks = tasks.copy()
-    
-    if status_filter != "Tous":
-        if status_filter == "Terminées":
-            filtered_tasks = [t for t in filtered_tasks if t.get("completed", False)]
-        elif status_filter == "À faire":
-            filtered_tasks = [t for t in filtered_tasks if not t.get("completed", False)]
-        elif status_filter == "En cours":
-            filtered_tasks = [t for t in filtered_tasks if not t.get("completed", False) and t.get("priority") in ["high", "medium"]]
-    
-    if priority_filter != "Toutes":
-        filtered_tasks = [t for t in filtered_tasks if t.get("priority") == priority_filter]
+    # Filtrer les tâches en une seule passe
+    want_status = STATUS_FILTERS[status_filter]
+    want_priority = None if priority_filter == "Toutes" else priority_filter
+    filtered_tasks = [
+        task for task in tasks
+        if (want_status is None or task["status"] in want_status)
+        and (want_priority is None or task.get("priority") == want_priority)
+    ]
     
     # Afficher les tâches
     st.markdown(f"### 📋 Actions ({len(filtered_tasks)} tâches)")
@@ -161,9 +283,9 @@ def show_pillar_actions_popup(pillar_id, pillar_data, tasks):
         return
     
     # Résumé du pilier
-    completed_count = len([t for t in tasks if t.get("completed", False)])
-    in_progress_count = len([t for t in tasks if not t.get("completed", False) and t.get("priority") in ["high", "medium"]])
-    todo_count = len(tasks) - completed_count - in_progress_count
+    completed_count = pillar_stats["completed"]
+    in_progress_count = pillar_stats["in_progress"]
+    todo_count = pillar_stats["todo"]
     
     st.markdown("### 📊 Résumé du pilier:")
     col1, col2, col3, col4 = st.columns(4)
@@ -179,13 +301,18 @@ def show_pillar_actions_popup(pillar_id, pillar_data, tasks):
     
     st.markdown("---")
     
-    # Afficher les tâches filtrées
+    # Afficher les tâches filtrées : un seul bloc HTML pour les longues listes
+    if len(filtered_tasks) > _DETAILS_THRESHOLD:
+        st.markdown(
+            "\n".join(build_task_details_html(task) for task in filtered_tasks),
+            unsafe_allow_html=True,
+        )
+        return
+    
     for i, task in enumerate(filtered_tasks):
-        status_icon = "✅" if task.get('completed') else "⏳"
-        if not task.get('completed') and task.get('priority') == 'high':
-            status_icon = "🔄"
+        status = task["status"]
         
-        with st.expander(f"{status_icon} {task.get('task', 'Tâche sans titre')}", expanded=False):
+        with st.expander(f"{STATUS_ICON[status]} {task.get('task', 'Tâche sans titre')}", expanded=False):
             
             col1, col2 = st.columns([3, 1])
             
@@ -196,66 +323,58 @@ def show_pillar_actions_popup(pillar_id, pillar_data, tasks):
                 st.markdown("**Responsable:**")
                 st.write(task.get('responsible', 'Non assigné'))
                 
-                if task.get('deliverables'):
+                if task["_deliverables_md"]:
                     st.markdown("**Livrables attendus:**")
-                    for deliverable in task['deliverables']:
-                        st.write(f"• {deliverable}")
+                    st.markdown(task["_deliverables_md"])
             
             with col2:
                 # Statut
-                if task.get('completed'):
-                    status = "✅ Terminée"
-                    status_color = "#28a745"
-                elif task.get('priority') == 'high':
-                    status = "🔄 En cours"
-                    status_color = "#ffc107"
-                else:
-                    status = "⏳ À faire"
-                    status_color = "#6c757d"
-                
                 st.markdown("**Statut:**")
-                st.markdown(f'<span style="color: {status_color}; font-weight: bold;">{status}</span>', unsafe_allow_html=True)
+                st.markdown(f'<span style="color: {STATUS_COLOR[status]}; font-weight: bold;">{STATUS_LABEL[status]}</span>', unsafe_allow_html=True)
                 
                 st.markdown("**Priorité:**")
-                priority_icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(task.get('priority', 'low'), "⚪")
-                priority_text = task.get('priority', 'low').title()
-                st.write(f"{priority_icon} {priority_text}")
+                st.write(f"{task['_prio_icon']} {task['_prio_label']}")
                 
                 # Progression estimée
-                if task.get('completed'):
-                    progress = 100
-                elif task.get('priority') == 'high':
-                    progress = 60
-                elif task.get('priority') == 'medium':
-                    progress = 30
-                else:
-                    progress = 10
+                progress = task["progress"]
                 
                 st.markdown("**Progression:**")
                 st.progress(progress / 100)
                 st.write(f"{progress}%")
 
-def show_pillar_grid(actions_data, checklist_data):
+def show_pillar_grid(actions_data, pillar_tasks, pillar_stats):
     """Affiche la grille des piliers avec leurs métriques"""
     
     st.markdown("## 🏛️ Framework CRO - 6 Piliers")
     st.markdown("Cliquez sur un pilier pour voir ses actions détaillées")
     
-    # Grille 2x3 pour les 6 piliers
-    for row in range(2):
-        cols = st.columns(3)
-        for col_idx in range(3):
-            pillar_idx = row * 3 + col_idx + 1
-            pillar_key = f"pillar_{pillar_idx}"
-            
-            if pillar_key in actions_data.get("pillars", {}):
-                pillar_data = actions_data["pillars"][pillar_key]
-                
-                # Récupérer les tâches du pilier depuis checklist_data
-                pillar_tasks = checklist_data.get(pillar_key, {}).get("tasks", [])
-                
-                with cols[col_idx]:
-                    create_pillar_card(pillar_key, pillar_data, pillar_tasks)
+    all_pillars = actions_data.get("pillars", {})
+    pillars = [
+        (pillar_key, all_pillars[pillar_key])
+        for pillar_key in _PILLAR_KEYS
+        if pillar_key in all_pillars
+    ]
+    if not pillars:
+        return
+    
+    # Grille 2x3 des 6 piliers émise en un seul bloc HTML
+    st.markdown(render_pillar_grid_html(pillars, pillar_stats), unsafe_allow_html=True)
+    
+    # Boutons pour ouvrir le popup de chaque pilier
+    cols = st.columns(len(pillars))
+    for col, (pillar_key, pillar_data) in zip(cols, pillars):
+        with col:
+            if st.button(
+                f"{pillar_data['icon']} Voir les actions",
+                key=f"btn_{pillar_key}",
+                help=f"Cliquer pour voir les actions du pilier {pillar_data['name']}",
+            ):
+                show_pillar_actions_popup(
+                    pillar_key,
+                    pillar_data,
+                    pillar_tasks.get(pillar_key, ()),
+                    pillar_stats.get(pillar_key, _EMPTY_PILLAR_STATS),
+                )
 
 def show_global_progress_summary(actions_data):
     """Affiche le résumé global de progression"""
@@ -306,67 +425,42 @@ def show_global_progress_summary(actions_data):
     st.markdown(f"**{completion_pct:.1f}% complété**")
     
     # Message de statut avec meilleure lisibilité
-    if completion_pct < 30:
-        status_color = "#dc3545"
-        status_message = "⚠️ Progrès modéré. Accélérer la mise en œuvre des actions prioritaires."
-    elif completion_pct < 70:
-        status_color = "#ffc107"
-        status_message = "🔄 Progression satisfaisante. Maintenir l'effort sur les piliers critiques."
-    else:
-        status_color = "#28a745"
-        status_message = "✅ Excellente progression. Framework CRO bien avancé."
+    status_color, status_message = _PROGRESS_MESSAGES[bisect_right(_PROGRESS_THRESHOLDS, completion_pct)]
     
     st.markdown(f'<div style="padding: 15px; background-color: #f8f9fa; border-left: 4px solid {status_color}; border-radius: 5px; margin: 15px 0;"><strong style="color: {status_color};">{status_message}</strong></div>', unsafe_allow_html=True)
 
-def show_top_priority_actions(checklist_data):
+def show_top_priority_actions(top_tasks):
     """Affiche les 3 actions prioritaires les plus importantes"""
     
     st.markdown("### 🔥 Top 3 Actions Prioritaires")
     
-    # Collecter toutes les tâches non terminées avec priorité haute
-    all_high_priority_tasks = []
-    
-    for pillar_id, pillar_data in checklist_data.items():
-        pillar_title = pillar_data.get("title", "")
-        tasks = pillar_data.get("tasks", [])
-        
-        for task in tasks:
-            if not task.get("completed", False) and task.get("priority") == "high":
-                task_with_pillar = task.copy()
-                task_with_pillar["pillar_title"] = pillar_title
-                task_with_pillar["pillar_id"] = pillar_id
-                all_high_priority_tasks.append(task_with_pillar)
-    
-    # Prendre les 3 premières
-    top_tasks = all_high_priority_tasks[:3]
-    
-    for i, task in enumerate(top_tasks, 1):
-        with st.container():
-            st.markdown(f"""
-            <div style="
-                border-left: 4px solid #dc3545;
-                padding: 15px;
-                margin: 10px 0;
-                background: linear-gradient(135deg, #fff5f5 0%, #ffffff 100%);
-                border-radius: 0 8px 8px 0;
-                box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-            ">
-                <h4 style="color: #dc3545; margin: 0 0 10px 0; font-weight: 600;">🔥 Priorité {i}: {task.get('task', 'Tâche sans titre')}</h4>
-                <p style="margin: 5px 0; color: #495057;"><strong>Pilier:</strong> {task.get('pillar_title', 'Non spécifié')}</p>
-                <p style="margin: 5px 0; color: #495057;"><strong>Responsable:</strong> {task.get('responsible', 'Non assigné')}</p>
-                <p style="margin: 5px 0; color: #6c757d; font-size: 0.9rem;">{task.get('description', 'Pas de description')[:200]}...</p>
-            </div>
-            """, unsafe_allow_html=True)
+    html_parts = []
+    for i, (pillar_id, pillar_title, task) in enumerate(top_tasks, 1):
+        ctx = {
+            "rank": i,
+            "task": task.get('task', 'Tâche sans titre'),
+            "pillar_title": pillar_title or 'Non spécifié',
+            "responsible": task.get('responsible', 'Non assigné'),
+            "description": task["_desc_preview"],
+        }
+        html_parts.append(_PRIORITY_CARD_TEMPLATE.format_map(ctx))
+    
+    if html_parts:
+        st.markdown("\n".join(html_parts), unsafe_allow_html=True)
 
 def show_actions_dashboard():
     """Affiche le Dashboard Actions avec popups"""
     
     st.markdown("## 🗂️ Actions Dashboard - Pilotage du Framework CRO")
+    
+    if st.button("🔄 Recharger les données", key="reload_actions_data"):
+        reload_data()
+    
     st.markdown("---")
     
     # Chargement des données
-    actions_data = load_actions_dashboard_data()
-    checklist_data = load_checklist_data()
+    actions_data = get_actions()
+    view_model = build_view_model(get_checklist())
     
     # Résumé exécutif en haut
     show_global_progress_summary(actions_data)
@@ -374,10 +468,10 @@ def show_actions_dashboard():
     st.markdown("---")
     
     # Grille des piliers optimisée
-    show_pillar_grid(actions_data, checklist_data)
+    show_pillar_grid(actions_data, view_model["pillar_tasks"], view_model["pillar_stats"])
     
     st.markdown("---")
     
     # Actions prioritaires
-    show_top_priority_actions(checklist_data)
+    show_top_priority_actions(view_model["top3"])
 
@@ -1,10 +1,23 @@
 """
 Gestionnaire de données pour l'application CRO Dashboard
 """
-import json
+import logging
 import os
+import threading
+from collections import Counter
+from pathlib import Path
 from typing import Dict, List, Any
 
+import orjson
+import streamlit as st
+
+from utils.data_loader import load_json
+
+logger = logging.getLogger(__name__)
+
+# Catégories de kpi_data.json prises en compte dans le résumé des statuts
+KPI_CATEGORIES = ("capital_ratios", "liquidity_ratios", "risk_metrics", "performance_metrics")
+
 class DataManager:
     """Classe pour gérer les données de l'application CRO Dashboard"""
     
@@ -18,32 +31,54 @@ class DataManager:
         self.pillars_data = None
         self.kpi_data = None
         self.checklist_data = None
+        # Sérialise les mises à jour de la checklist entre les sessions qui partagent l'instance
+        self._write_lock = threading.Lock()
+        # Version de la checklist, incrémentée à chaque mise à jour (invalide les stats)
+        self._checklist_version = 0
+        self._completion_stats = None
+        self._completion_stats_version = -1
         self._load_all_data()
     
     def _load_all_data(self):
         """Charge toutes les données au démarrage"""
         self.pillars_data = self._load_json("pillars_data.json")
         self.kpi_data = self._load_json("kpi_data.json")
+        # Statuts de tous les KPIs à plat, extraits une fois au chargement
+        self._kpi_statuses = [
+            kpi.get("status", "green")
+            for category in KPI_CATEGORIES
+            for kpi in self.kpi_data.get(category, {}).values()
+        ]
+        # Liste des risques de la heatmap, résolue une fois au chargement
+        self._risk_heatmap = self.kpi_data.get("risk_heatmap", {}).get("risks", [])
         self.checklist_data = self._load_json("checklist_data.json")
+        # (pilier, id de tâche) -> tâche : référence vers la même tâche que la checklist
+        self._task_index = {
+            (pillar_id, task["id"]): task
+            for pillar_id, pillar_data in self.checklist_data.items()
+            for task in pillar_data["tasks"]
+        }
     
     def _load_json(self, filename: str) -> Dict:
         """Charge un fichier JSON"""
         filepath = os.path.join(self.data_dir, filename)
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Fichier {filepath} non trouvé")
+        if not os.path.isfile(filepath):
+            logger.warning(f"Fichier {filepath} non trouvé")
             return {}
-        except json.JSONDecodeError:
-            print(f"Erreur de décodage JSON pour {filepath}")
+        try:
+            return load_json(filepath, os.path.getmtime(filepath))
+        except orjson.JSONDecodeError:
+            logger.warning(f"Erreur de décodage JSON pour {filepath}")
             return {}
     
     def _save_json(self, data: Dict, filename: str):
         """Sauvegarde un fichier JSON"""
         filepath = os.path.join(self.data_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # UTF-8 brut (équivalent de ensure_ascii=False), indentation à 2 espaces ;
+        # fichier temporaire puis renommage atomique pour ne jamais laisser un JSON tronqué
+        tmp_path = f"{filepath}.tmp"
+        Path(tmp_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, filepath)
     
     def get_pillar_data(self, pillar_id: str) -> Dict:
         """Récupère les données d'un pilier spécifique"""
@@ -63,23 +98,28 @@ class DataManager:
     
     def update_task_status(self, pillar_id: str, task_id: str, completed: bool):
         """Met à jour le statut d'une tâche"""
-        if pillar_id in self.checklist_data:
-            tasks = self.checklist_data[pillar_id]["tasks"]
-            for task in tasks:
-                if task["id"] == task_id:
-                    task["completed"] = completed
-                    break
-        self._save_json(self.checklist_data, "checklist_data.json")
+        task = self._task_index.get((pillar_id, task_id))
+        if task is None:
+            return
+        # Écriture synchrone et atomique : la mise à jour est sur disque avant le rerun suivant
+        with self._write_lock:
+            task["completed"] = completed
+            self._checklist_version += 1
+            self._save_json(self.checklist_data, "checklist_data.json")
     
     def get_completion_stats(self) -> Dict:
-        """Calcule les statistiques de completion"""
+        """Calcule les statistiques de completion (recalculées seulement après une mise à jour)"""
+        if self._completion_stats_version == self._checklist_version:
+            return self._completion_stats
+        
         stats = {}
         total_tasks = 0
         completed_tasks = 0
         
         for pillar_id, pillar_data in self.checklist_data.items():
-            pillar_total = len(pillar_data["tasks"])
-            pillar_completed = sum(1 for task in pillar_data["tasks"] if task["completed"])
+            tasks = pillar_data["tasks"]
+            pillar_total = len(tasks)
+            pillar_completed = sum(task["completed"] for task in tasks)
             
             stats[pillar_id] = {
                 "total": pillar_total,
@@ -96,21 +136,40 @@ class DataManager:
             "percentage": (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         }
         
+        self._completion_stats = stats
+        self._completion_stats_version = self._checklist_version
         return stats
     
     def get_risk_heatmap_data(self) -> List[Dict]:
         """Récupère les données pour la heatmap des risques"""
-        return self.kpi_data.get("risk_heatmap", {}).get("risks", [])
+        return self._risk_heatmap
     
     def get_kpi_status_summary(self) -> Dict:
         """Résumé du statut des KPIs"""
         summary = {"green": 0, "orange": 0, "red": 0}
-        
-        for category in ["capital_ratios", "liquidity_ratios", "risk_metrics", "performance_metrics"]:
-            if category in self.kpi_data:
-                for kpi_name, kpi_data in self.kpi_data[category].items():
-                    status = kpi_data.get("status", "green")
-                    summary[status] = summary.get(status, 0) + 1
-        
+        summary.update(Counter(self._kpi_statuses))
         return summary
 
+# Fichiers lus par DataManager, dont les dates de modification forment la clé du cache
+DATA_FILES = ("pillars_data.json", "kpi_data.json", "checklist_data.json")
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_data_manager_cached(mtimes: tuple) -> DataManager:
+    """Instance partagée pour une version des fichiers ; les mises à jour passent par son verrou"""
+    return DataManager()
+
+def get_data_manager() -> DataManager:
+    """
+    Instance unique de DataManager par processus serveur
+    
+    Partagée par tous les reruns et toutes les sessions, et reconstruite
+    seulement lorsqu'un des fichiers JSON est modifié hors de l'application.
+    """
+    data_dir = os.path.dirname(os.path.abspath(__file__))
+    mtimes = []
+    for filename in DATA_FILES:
+        try:
+            mtimes.append(os.path.getmtime(os.path.join(data_dir, filename)))
+        except FileNotFoundError:
+            mtimes.append(0.0)
+    return _get_data_manager_cached(tuple(mtimes))
@@ -2,22 +2,42 @@
 Module Benchmarking et Alertes - CRO Dashboard Phase 1 Workstream 1.3
 Implémentation du benchmarking sectoriel et système d'alertes automatisées
 """
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
-import json
 import numpy as np
 from typing import Dict, List, Any, Tuple
 import logging
 from datetime import datetime, timedelta
+from ux_enhancements import WEBGL_MIN_POINTS
+from utils.data_loader import load_json
 
 # Configuration logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Colonnes du tableau des seuils réglementaires
+THRESHOLDS_COLUMNS = ['Métrique', 'Minimum Réglementaire', 'Exigence Totale', 'Buffer Management', 'Cible Interne']
+
+BENCHMARKING_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "benchmarking_data.json"
+
+@dataclass(slots=True)
+class BenchmarkingView:
+    """Sections des données de benchmarking, extraites une fois au chargement"""
+    metrics: Dict[str, Any]
+    alerts: List[Dict]
+    priority_gaps: List[Dict]
+    time_series: Dict[str, Any]
+    regulatory: Dict[str, Any]
+    best_practices: List[Dict]
+    alert_cards_html: List[str]
+    metric_stats: Dict[str, Any]
+
 class BenchmarkingAlertsManager:
     """Gestionnaire du benchmarking et des alertes"""
     
@@ -25,18 +45,31 @@ class BenchmarkingAlertsManager:
         """Initialisation du gestionnaire"""
         self.benchmarking_data = self._load_benchmarking_data()
         
+        data = self.benchmarking_data
+        peer_benchmarks = data.get('peer_benchmarks', {})
+        alerts = data.get('current_alerts', [])
+        # HTML des cartes construit une fois par chargement, pas à chaque rendu
+        self.alert_cards_html = [build_alert_card_html(alert) for alert in alerts]
+        metrics = peer_benchmarks.get('european_banks_tier1', {}).get('metrics', {})
+        self.view = BenchmarkingView(
+            metrics=metrics,
+            alerts=alerts,
+            priority_gaps=data.get('performance_gaps', {}).get('priority_gaps', []),
+            time_series=data.get('time_series_benchmarks', {}).get('cet1_evolution_vs_peers', {}),
+            regulatory=peer_benchmarks.get('regulatory_minimums', {}),
+            best_practices=data.get('best_practices', {}).get('top_performers', []),
+            alert_cards_html=self.alert_cards_html,
+            # Statistiques calculées une fois par chargement, lues par les sections
+            metric_stats=compute_metric_statistics(metrics)
+        )
+        
     def _load_benchmarking_data(self) -> Dict[str, Any]:
         """
-        Charge les données de benchmarking de manière générique.
+        Charge les données de benchmarking via le cache partagé entre les reruns.
         """
+        file_path = BENCHMARKING_DATA_PATH
         try:
-            base_path = Path(__file__).resolve().parent.parent
-            file_path = base_path / "data" / "benchmarking_data.json"
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            logger.info("Données de benchmarking chargées avec succès depuis: " + str(file_path))
-            return data
+            return load_json(str(file_path), file_path.stat().st_mtime)
         except FileNotFoundError:
             logger.error(f"Fichier benchmarking_data.json non trouvé au chemin attendu: {file_path}")
             return self._get_default_benchmarking_data()
@@ -52,7 +85,26 @@ class BenchmarkingAlertsManager:
             "performance_gaps": {"priority_gaps": []}
         }
 
-def create_peer_comparison_chart(metric_data: Dict, metric_name: str) -> go.Figure:
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_benchmarking_manager_cached(mtime: float) -> BenchmarkingAlertsManager:
+    """Instance partagée pour une version du fichier : ne pas la modifier en place"""
+    return BenchmarkingAlertsManager()
+
+def get_benchmarking_manager() -> BenchmarkingAlertsManager:
+    """
+    Instance unique de BenchmarkingAlertsManager par processus serveur
+    
+    Partagée par tous les reruns et toutes les sessions, et reconstruite
+    seulement lorsque benchmarking_data.json est modifié.
+    """
+    try:
+        mtime = BENCHMARKING_DATA_PATH.stat().st_mtime
+    except FileNotFoundError:
+        mtime = 0.0
+    return _get_benchmarking_manager_cached(mtime)
+
+@st.cache_data(show_spinner=False)
+def create_peer_comparison_chart(metric_data: Dict, metric_name: str) -> Dict[str, Any]:
     """
     Crée un graphique de comparaison avec les peers
     
@@ -61,10 +113,10 @@ def create_peer_comparison_chart(metric_data: Dict, metric_name: str) -> go.Figu
         metric_name: Nom de la métrique
         
     Returns:
-        Figure Plotly de comparaison peers
+        Figure Plotly de comparaison peers (dict, mis en cache)
     """
     if not metric_data:
-        return go.Figure()
+        return go.Figure().to_dict()
     
     # Extraction des données
     p10 = metric_data.get('p10', 0)
@@ -77,9 +129,14 @@ def create_peer_comparison_chart(metric_data: Dict, metric_name: str) -> go.Figu
     
     fig = go.Figure()
     
-    # Box plot des peers
+    # Box plot des peers à partir des percentiles connus (pas de recalcul côté navigateur)
     fig.add_trace(go.Box(
-        y=[p10, p25, median, p75, p90],
+        x=["Distribution Peers"],
+        q1=[p25],
+        median=[median],
+        q3=[p75],
+        lowerfence=[p10],
+        upperfence=[p90],
         name="Distribution Peers",
         boxpoints=False,
         fillcolor='rgba(59, 130, 246, 0.3)',
@@ -104,26 +161,38 @@ def create_peer_comparison_chart(metric_data: Dict, metric_name: str) -> go.Figu
         textposition="middle right"
     ))
     
-    # Annotations des percentiles
-    annotations = [
-        dict(x=0.1, y=p90, text=f"P90: {p90:.1f}%", showarrow=False, font=dict(size=10)),
-        dict(x=0.1, y=p75, text=f"P75: {p75:.1f}%", showarrow=False, font=dict(size=10)),
-        dict(x=0.1, y=median, text=f"Médiane: {median:.1f}%", showarrow=False, font=dict(size=12, color='orange')),
-        dict(x=0.1, y=p25, text=f"P25: {p25:.1f}%", showarrow=False, font=dict(size=10)),
-        dict(x=0.1, y=p10, text=f"P10: {p10:.1f}%", showarrow=False, font=dict(size=10))
-    ]
+    # Libellés des percentiles en une seule trace texte (au lieu de 5 annotations de layout)
+    fig.add_trace(go.Scatter(
+        x=["Distribution Peers"] * 5,
+        y=[p90, p75, median, p25, p10],
+        mode='text',
+        text=[
+            f"P90: {p90:.1f}%",
+            f"P75: {p75:.1f}%",
+            f"Médiane: {median:.1f}%",
+            f"P25: {p25:.1f}%",
+            f"P10: {p10:.1f}%"
+        ],
+        textposition='middle right',
+        textfont=dict(
+            size=[10, 10, 12, 10, 10],
+            color=['#374151', '#374151', 'orange', '#374151', '#374151']
+        ),
+        hoverinfo='skip',
+        showlegend=False
+    ))
     
     fig.update_layout(
         title=f"Benchmark {metric_name} vs Peers Européens Tier 1",
         yaxis_title=f"{metric_name}",
         height=400,
-        annotations=annotations,
         showlegend=True
     )
     
-    return fig
+    return fig.to_dict()
 
-def create_performance_gap_chart(gaps_data: List[Dict]) -> go.Figure:
+@st.cache_data(show_spinner=False)
+def create_performance_gap_chart(gaps_data: List[Dict]) -> Dict[str, Any]:
     """
     Crée un graphique des écarts de performance
     
@@ -131,14 +200,14 @@ def create_performance_gap_chart(gaps_data: List[Dict]) -> go.Figure:
         gaps_data: Liste des écarts de performance
         
     Returns:
-        Figure Plotly des écarts
+        Figure Plotly des écarts (dict, mis en cache)
     """
     if not gaps_data:
-        return go.Figure()
+        return go.Figure().to_dict()
     
     metrics = [gap['metric'].replace('_', ' ').title() for gap in gaps_data]
-    gaps = [gap['gap'] for gap in gaps_data]
-    colors = ['#ef4444' if gap < 0 else '#10b981' for gap in gaps]
+    gaps = np.fromiter((gap['gap'] for gap in gaps_data), dtype=np.float64, count=len(gaps_data))
+    colors = np.where(gaps < 0, '#ef4444', '#10b981').tolist()
     
     fig = go.Figure()
     
@@ -162,9 +231,10 @@ def create_performance_gap_chart(gaps_data: List[Dict]) -> go.Figure:
         showlegend=False
     )
     
-    return fig
+    return fig.to_dict()
 
-def create_time_series_benchmark_chart(time_series_data: Dict) -> go.Figure:
+@st.cache_data(show_spinner=False)
+def create_time_series_benchmark_chart(time_series_data: Dict) -> Dict[str, Any]:
     """
     Crée un graphique d'évolution vs peers dans le temps
     
@@ -172,32 +242,45 @@ def create_time_series_benchmark_chart(time_series_data: Dict) -> go.Figure:
         time_series_data: Données d'évolution temporelle
         
     Returns:
-        Figure Plotly d'évolution
+        Figure Plotly d'évolution (dict, mis en cache)
     """
     if not time_series_data:
-        return go.Figure()
+        return go.Figure().to_dict()
     
+    # Séries en float32 : Plotly les transmet en tableaux binaires deux fois plus compacts
     periods = time_series_data.get('periods', [])
-    our_bank = time_series_data.get('our_bank', [])
-    peer_median = time_series_data.get('peer_median', [])
-    peer_p25 = time_series_data.get('peer_p25', [])
-    peer_p75 = time_series_data.get('peer_p75', [])
+    our_bank = np.asarray(time_series_data.get('our_bank', []), dtype=np.float32)
+    peer_median = np.asarray(time_series_data.get('peer_median', []), dtype=np.float32)
+    peer_p25 = np.asarray(time_series_data.get('peer_p25', []), dtype=np.float32)
+    peer_p75 = np.asarray(time_series_data.get('peer_p75', []), dtype=np.float32)
     
     fig = go.Figure()
     
-    # Zone de confiance peers (P25-P75)
+    # Lignes en WebGL pour les longues séries (la zone remplie reste en SVG)
+    line_trace_type = go.Scattergl if len(periods) > WEBGL_MIN_POINTS else go.Scatter
+    
+    # Zone de confiance peers (P25-P75) : bord P25 invisible puis P75 rempli jusqu'à lui
     fig.add_trace(go.Scatter(
-        x=periods + periods[::-1],
-        y=peer_p75 + peer_p25[::-1],
-        fill='toself',
+        x=periods,
+        y=peer_p25,
+        mode='lines',
+        line=dict(color='rgba(0,0,0,0)'),
+        name='P25 Peers',
+        showlegend=False
+    ))
+    fig.add_trace(go.Scatter(
+        x=periods,
+        y=peer_p75,
+        mode='lines',
+        fill='tonexty',
         fillcolor='rgba(59, 130, 246, 0.2)',
-        line=dict(color='rgba(255,255,255,0)'),
+        line=dict(color='rgba(0,0,0,0)'),
         name='Zone P25-P75 Peers',
         showlegend=True
     ))
     
     # Médiane peers
-    fig.add_trace(go.Scatter(
+    fig.add_trace(line_trace_type(
         x=periods,
         y=peer_median,
         mode='lines+markers',
@@ -207,7 +290,7 @@ def create_time_series_benchmark_chart(time_series_data: Dict) -> go.Figure:
     ))
     
     # Notre banque
-    fig.add_trace(go.Scatter(
+    fig.add_trace(line_trace_type(
         x=periods,
         y=our_bank,
         mode='lines+markers',
@@ -224,14 +307,45 @@ def create_time_series_benchmark_chart(time_series_data: Dict) -> go.Figure:
         hovermode='x unified'
     )
     
-    return fig
+    return fig.to_dict()
+
+def compute_metric_statistics(metrics: Dict) -> Dict[str, Any]:
+    """
+    Calcule en une passe vectorisée les statistiques de toutes les métriques
+    
+    Args:
+        metrics: Métriques de benchmarking par nom
+        
+    Returns:
+        Z-scores par métrique, nombre et pourcentage de métriques au-dessus de la médiane
+    """
+    values = np.array([
+        (m.get('our_bank', 0), m.get('average', 0), m.get('std_dev', 0), m.get('vs_median', 0))
+        for m in metrics.values()
+    ], dtype=float).reshape(-1, 4)
+    our_bank, average, std_dev, vs_median = values.T
+    
+    # Z-score nul si l'écart-type n'est pas renseigné
+    z_scores = np.divide(our_bank - average, std_dev,
+                         out=np.zeros_like(std_dev), where=std_dev > 0)
+    
+    above_median = vs_median >= 0
+    
+    return {
+        'z_scores': dict(zip(metrics, z_scores.tolist())),
+        'above_median': int(np.count_nonzero(above_median)),
+        'performance_score': float(above_median.mean()) * 100 if len(above_median) else 0.0
+    }
 
-def create_alert_summary_card(alert: Dict) -> None:
+def build_alert_card_html(alert: Dict) -> str:
     """
-    Crée une carte d'alerte
+    Construit le HTML d'une carte d'alerte
     
     Args:
         alert: Données de l'alerte
+        
+    Returns:
+        HTML de la carte, à regrouper avec les autres cartes de la colonne
     """
     level = alert.get('level', 'info')
     
@@ -253,7 +367,7 @@ def create_alert_summary_card(alert: Dict) -> None:
     color = color_mapping.get(level, '#6b7280')
     icon = icon_mapping.get(level, '📊')
     
-    st.markdown(f"""
+    return f"""
     <div style="
         background: linear-gradient(135deg, {color}15 0%, {color}25 100%);
         border-left: 4px solid {color};
@@ -276,7 +390,7 @@ def create_alert_summary_card(alert: Dict) -> None:
             <span style="margin-left: auto;">{alert.get('date_created', '')}</span>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
 def create_improvement_roadmap_table(gaps_data: List[Dict]) -> pd.DataFrame:
     """
@@ -291,44 +405,46 @@ def create_improvement_roadmap_table(gaps_data: List[Dict]) -> pd.DataFrame:
     if not gaps_data:
         return pd.DataFrame()
     
-    roadmap_df = pd.DataFrame([
-        {
-            'Métrique': gap['metric'].replace('_', ' ').title(),
-            'Écart vs Peers': f"{gap['gap']:+.1f}pp ({gap['gap_percentage']:+.1f}%)",
-            'Action Requise': gap['required_improvement'],
-            'Coût Estimé': gap['estimated_cost'],
-            'Délai': gap['timeline'],
-            'Priorité': '🔴 Haute' if abs(gap['gap']) > 5 else '🟡 Moyenne'
-        }
-        for gap in gaps_data
-    ])
+    # Colonnes remplies en une passe puis DataFrame construit en une fois
+    metriques, ecarts, actions, couts, delais, priorites = [], [], [], [], [], []
+    for gap in gaps_data:
+        gap_value = gap['gap']
+        metriques.append(gap['metric'].replace('_', ' ').title())
+        ecarts.append(f"{gap_value:+.1f}pp ({gap['gap_percentage']:+.1f}%)")
+        actions.append(gap['required_improvement'])
+        couts.append(gap['estimated_cost'])
+        delais.append(gap['timeline'])
+        priorites.append('🔴 Haute' if abs(gap_value) > 5 else '🟡 Moyenne')
+    
+    roadmap_df = pd.DataFrame({
+        'Métrique': metriques,
+        'Écart vs Peers': ecarts,
+        'Action Requise': actions,
+        'Coût Estimé': couts,
+        'Délai': delais,
+        'Priorité': priorites
+    })
     
     return roadmap_df
 
-def show_benchmarking_alerts_dashboard():
-    """
-    Affiche le dashboard de benchmarking et alertes complet
-    """
-    st.markdown("## 🏆 Benchmarking & Alertes")
-    st.markdown("*Comparaison sectorielle et système d'alertes automatisées*")
-    
-    # Chargement des données
-    manager = BenchmarkingAlertsManager()
-    benchmarking_data = manager.benchmarking_data
+def _get_session_view() -> BenchmarkingView:
+    """Données de benchmarking du rerun complet courant, partagées avec les fragments"""
+    return st.session_state.benchmarking_view
+
+def _render_alerts_section():
+    """Section 1 - Alertes actives"""
+    view = _get_session_view()
     
     # === SECTION 1: ALERTES ACTIVES ===
     st.markdown("### 🚨 Alertes Actives")
     
-    current_alerts = benchmarking_data.get('current_alerts', [])
+    current_alerts = view.alerts
     
     if current_alerts:
         # Statistiques des alertes
         col1, col2, col3, col4 = st.columns(4)
         
-        alert_counts = {}
-        for alert in current_alerts:
-            level = alert.get('level', 'info')
-            alert_counts[level] = alert_counts.get(level, 0) + 1
+        alert_counts = Counter(alert.get('level', 'info') for alert in current_alerts)
         
         with col1:
             st.metric("🚨 Critiques", alert_counts.get('critical', 0))
@@ -349,25 +465,23 @@ def show_benchmarking_alerts_dashboard():
         
         col1, col2 = st.columns(2)
         
-        # Répartition des alertes par colonnes
-        for i, alert in enumerate(current_alerts):
-            if i % 2 == 0:
-                with col1:
-                    create_alert_summary_card(alert)
-            else:
-                with col2:
-                    create_alert_summary_card(alert)
+        # Répartition des alertes par colonnes, un seul bloc HTML par colonne
+        cards_html = view.alert_cards_html
+        col1.markdown("\n".join(cards_html[0::2]), unsafe_allow_html=True)
+        col2.markdown("\n".join(cards_html[1::2]), unsafe_allow_html=True)
     
     else:
         st.info("🎉 Aucune alerte active - Tous les indicateurs sont dans les seuils acceptables")
-    
-    st.markdown("---")
+
+@st.fragment
+def _render_benchmarking_section():
+    """Section 2 - Benchmarking sectoriel (fragment : sélecteur de métrique)"""
+    view = _get_session_view()
     
     # === SECTION 2: BENCHMARKING SECTORIEL ===
     st.markdown("### 🏆 Benchmarking Sectoriel")
     
-    peer_benchmarks = benchmarking_data.get('peer_benchmarks', {}).get('european_banks_tier1', {})
-    metrics = peer_benchmarks.get('metrics', {})
+    metrics = view.metrics
     
     if metrics:
         # Sélection de métrique pour analyse détaillée
@@ -417,22 +531,21 @@ def show_benchmarking_alerts_dashboard():
                 )
             
             with col4:
-                std_dev = metric_data.get('std_dev', 0)
-                our_bank = metric_data.get('our_bank', 0)
-                average = metric_data.get('average', 0)
-                z_score = (our_bank - average) / std_dev if std_dev > 0 else 0
+                z_score = view.metric_stats['z_scores'][selected_metric]
                 st.metric(
                     "Z-Score",
                     f"{z_score:.1f}σ",
                     help="Écart-type par rapport à la moyenne"
                 )
-    
-    st.markdown("---")
+
+def _render_gaps_section():
+    """Section 3 - Écarts de performance"""
+    view = _get_session_view()
     
     # === SECTION 3: ÉCARTS DE PERFORMANCE ===
     st.markdown("### 📈 Analyse des Écarts de Performance")
     
-    performance_gaps = benchmarking_data.get('performance_gaps', {}).get('priority_gaps', [])
+    performance_gaps = view.priority_gaps
     
     if performance_gaps:
         col1, col2 = st.columns(2)
@@ -444,7 +557,7 @@ def show_benchmarking_alerts_dashboard():
         
         with col2:
             # Évolution temporelle vs peers
-            time_series_data = benchmarking_data.get('time_series_benchmarks', {}).get('cet1_evolution_vs_peers', {})
+            time_series_data = view.time_series
             if time_series_data:
                 fig_evolution = create_time_series_benchmark_chart(time_series_data)
                 st.plotly_chart(fig_evolution, use_container_width=True)
@@ -455,17 +568,25 @@ def show_benchmarking_alerts_dashboard():
         roadmap_df = create_improvement_roadmap_table(performance_gaps)
         if not roadmap_df.empty:
             st.dataframe(roadmap_df, use_container_width=True, hide_index=True)
-    
-    st.markdown("---")
+
+@st.fragment
+def _render_best_practices_section():
+    """Section 4 - Meilleures pratiques (fragment : toggles de détail)"""
+    view = _get_session_view()
     
     # === SECTION 4: MEILLEURES PRATIQUES ===
     st.markdown("### 💡 Meilleures Pratiques des Top Performers")
     
-    best_practices = benchmarking_data.get('best_practices', {}).get('top_performers', [])
+    best_practices = view.best_practices
     
     if best_practices:
         for i, performer in enumerate(best_practices):
-            with st.expander(f"🏆 {performer.get('bank', f'Top Performer {i+1}')}"):
+            # Détail construit seulement une fois demandé : l'état du toggle est
+            # gardé en session, et le basculer ne rerun que ce fragment
+            if not st.toggle(f"🏆 {performer.get('bank', f'Top Performer {i+1}')}", key=f"tp_show_{i}"):
+                continue
+            
+            with st.container(border=True):
                 
                 # Métriques de performance
                 metrics_to_show = {k: v for k, v in performer.items() 
@@ -486,40 +607,48 @@ def show_benchmarking_alerts_dashboard():
                     st.markdown("**Facteurs Clés de Succès:**")
                     for factor in key_factors:
                         st.markdown(f"• {factor}")
-    
-    st.markdown("---")
+
+def _render_thresholds_section():
+    """Section 5 - Seuils réglementaires et targets"""
+    view = _get_session_view()
     
     # === SECTION 5: SEUILS ET TARGETS ===
     st.markdown("### 🎯 Seuils Réglementaires et Targets")
     
-    regulatory_minimums = benchmarking_data.get('peer_benchmarks', {}).get('regulatory_minimums', {})
+    regulatory_minimums = view.regulatory
     
     if regulatory_minimums:
         # Tableau des seuils
-        thresholds_data = []
+        thresholds_rows = []
         for metric, thresholds in regulatory_minimums.items():
             if isinstance(thresholds, dict):
-                thresholds_data.append({
-                    'Métrique': metric.replace('_', ' ').title(),
-                    'Minimum Réglementaire': f"{thresholds.get('regulatory_minimum', thresholds.get('pillar1', 0)):.1f}%",
-                    'Exigence Totale': f"{thresholds.get('total_requirement', 0):.1f}%",
-                    'Buffer Management': f"{thresholds.get('management_buffer', 0):.1f}%",
-                    'Cible Interne': f"{thresholds.get('internal_target', 0):.1f}%"
-                })
+                thresholds_rows.append((
+                    metric.replace('_', ' ').title(),
+                    f"{thresholds.get('regulatory_minimum', thresholds.get('pillar1', 0)):.1f}%",
+                    f"{thresholds.get('total_requirement', 0):.1f}%",
+                    f"{thresholds.get('management_buffer', 0):.1f}%",
+                    f"{thresholds.get('internal_target', 0):.1f}%"
+                ))
         
-        if thresholds_data:
-            thresholds_df = pd.DataFrame(thresholds_data)
+        if thresholds_rows:
+            thresholds_df = pd.DataFrame.from_records(thresholds_rows, columns=THRESHOLDS_COLUMNS)
             st.dataframe(thresholds_df, use_container_width=True, hide_index=True)
+
+def _render_executive_summary():
+    """Résumé exécutif"""
+    view = _get_session_view()
+    metrics = view.metrics
+    current_alerts = view.alerts
+    performance_gaps = view.priority_gaps
     
-    # Résumé exécutif
-    st.markdown("---")
     st.markdown("### 📋 Résumé Exécutif")
     
     # Calcul du score global de performance
     if metrics:
         total_metrics = len(metrics)
-        above_median = sum(1 for m in metrics.values() if m.get('vs_median', 0) >= 0)
-        performance_score = (above_median / total_metrics) * 100
+        metric_stats = view.metric_stats
+        above_median = metric_stats['above_median']
+        performance_score = metric_stats['performance_score']
         
         col1, col2, col3 = st.columns(3)
         
@@ -546,6 +675,33 @@ def show_benchmarking_alerts_dashboard():
                 "Actions d'amélioration identifiées"
             )
 
+def show_benchmarking_alerts_dashboard():
+    """
+    Affiche le dashboard de benchmarking et alertes complet
+    
+    Les sections à widgets (benchmarking, meilleures pratiques) sont des
+    fragments : un changement de métrique ou l'ouverture d'un détail ne
+    reconstruit que cette section, pas les autres graphiques.
+    """
+    st.markdown("## 🏆 Benchmarking & Alertes")
+    st.markdown("*Comparaison sectorielle et système d'alertes automatisées*")
+    
+    # Chargement des données (relues par les fragments lors de leurs reruns)
+    st.session_state.benchmarking_view = get_benchmarking_manager().view
+    
+    _render_alerts_section()
+    st.markdown("---")
+    _render_benchmarking_section()
+    st.markdown("---")
+    _render_gaps_section()
+    st.markdown("---")
+    _render_best_practices_section()
+    st.markdown("---")
+    _render_thresholds_section()
+    
+    st.markdown("---")
+    _render_executive_summary()
+
 if __name__ == "__main__":
     show_benchmarking_alerts_dashboard()
 
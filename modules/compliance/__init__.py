@@ -3,7 +3,10 @@ Module Compliance - Conformité Réglementaire
 Implémentation des Piliers 1, 2, 3 et du reporting réglementaire
 """
 
-from .pillar1 import Pillar1Calculator, CreditExposure, MarketExposure, OperationalRisk
+from .pillar1 import (
+    Pillar1Calculator, CreditExposure, MarketExposure, OperationalRisk,
+    CreditPortfolio, MarketPortfolio, OperationalPortfolio
+)
 from .pillar2 import Pillar2Calculator, ICAAPresult, SREPAssessment, LiquidityMetric
 from .pillar3 import Pillar3Calculator, DisclosureRequirement, MarketSensitivity
 from .reporting import RegulatoryReportingEngine, ReportTemplate, ReportSubmission
@@ -16,6 +19,9 @@ __all__ = [
     'CreditExposure',
     'MarketExposure',
     'OperationalRisk',
+    'CreditPortfolio',
+    'MarketPortfolio',
+    'OperationalPortfolio',
     'ICAAPresult',
     'SREPAssessment',
     'LiquidityMetric',
@@ -5,17 +5,44 @@ Calcul des RWA (Risk Weighted Assets) par type de risque selon Bâle III/IV
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, fields
 from datetime import datetime
 import json
 import logging
+import os
+from functools import lru_cache
+from types import MappingProxyType
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Types de contrepartie de l'approche standard, dans l'ordre des lignes de la table des poids
+RISK_WEIGHT_COUNTERPARTY_TYPES = ("SOVEREIGN", "CORPORATE", "RETAIL")
+# Échelle de notation, premières catégories de la colonne rating des portefeuilles
+RATING_CATEGORIES = ("AAA", "AA", "A", "BBB", "BB", "B", "CCC")
+
+def _category_codes(column: pd.Series, categories: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Codes catégoriels d'une colonne et position de chaque code dans categories
+    
+    Returns:
+        (codes par ligne, positions par code) ; positions a une entrée de plus,
+        la dernière, atteinte par le code -1, et vaut -1 comme toute valeur absente
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        # Colonne déjà catégorielle : on garde ses codes, seules ses catégories sont recodées
+        positions = pd.Index(categories).get_indexer(column.cat.categories)
+        return column.cat.codes.to_numpy(), np.append(positions, -1)
+    codes = pd.Categorical(column, categories=categories).codes
+    return codes, np.append(np.arange(len(categories)), -1)
+
+def _totals_by_key(totals: pd.Series) -> Dict:
+    """Dictionnaire d'un agrégat groupby(dropna=False), la clé manquante (NaN) rendue en None"""
+    return {None if pd.isna(key) else key: value for key, value in totals.items()}
+
+@dataclass(slots=True)
 class CreditExposure:
     """Classe pour représenter une exposition au risque de crédit"""
     exposure_id: str
@@ -33,7 +60,7 @@ class CreditExposure:
     lgd: float = 0.45  # Loss Given Default par défaut
     pd: float = 0.01   # Probability of Default par défaut
 
-@dataclass
+@dataclass(slots=True)
 class MarketExposure:
     """Classe pour représenter une exposition au risque de marché"""
     position_id: str
@@ -46,13 +73,111 @@ class MarketExposure:
     vega: float
     theta: float
 
-@dataclass
+@dataclass(slots=True)
 class OperationalRisk:
     """Classe pour représenter le risque opérationnel"""
     business_line: str
     gross_income: float
     beta_factor: float = 0.15  # Facteur beta standard
 
+@lru_cache(maxsize=8)
+def _read_config(config_path: str, mtime: float) -> Dict:
+    """
+    Configuration JSON parsée une fois par fichier et par version
+    
+    mtime ne sert que de clé de cache. Le dictionnaire est partagé entre
+    calculateurs : ne pas le modifier en place.
+    """
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+@lru_cache(maxsize=8)
+def _risk_weight_tables(risk_weights_json: str) -> Tuple:
+    """
+    Tables de poids de risque d'une configuration, construites une seule fois et figées
+    
+    - lut : (type, notation, produit) -> poids, pour une exposition isolée
+    - table : tableau (types + 1, notations + 1) indexé par les codes catégoriels ;
+      la dernière ligne/colonne (code -1 = inconnu) vaut le poids par défaut
+    
+    Returns:
+        (notations, lut, table, poids prêt immobilier)
+    """
+    risk_weights = json.loads(risk_weights_json)
+    sovereign = risk_weights["sovereign"]
+    corporate = risk_weights["corporate"]
+    retail = risk_weights["retail"]
+    
+    ratings = tuple(dict.fromkeys([*sovereign, *corporate]))
+    
+    lut = {}
+    for rating, weight in sovereign.items():
+        lut[("SOVEREIGN", rating, None)] = weight
+    for rating, weight in corporate.items():
+        lut[("CORPORATE", rating, None)] = weight
+    lut[("RETAIL", None, "PRET_IMMOBILIER")] = retail["mortgage"]
+    lut[("RETAIL", None, None)] = retail["standard"]
+    
+    n_ratings = len(ratings)
+    table = np.ones((len(RISK_WEIGHT_COUNTERPARTY_TYPES) + 1, n_ratings + 1), dtype=np.float64)
+    for row, weights in enumerate((sovereign, corporate)):
+        table[row, :n_ratings] = [weights.get(rating, 1.0) for rating in ratings]
+    # Le poids retail ne dépend pas de la notation (prêt immobilier traité à part)
+    table[RISK_WEIGHT_COUNTERPARTY_TYPES.index("RETAIL"), :] = retail["standard"]
+    table.setflags(write=False)
+    
+    return ratings, MappingProxyType(lut), table, retail["mortgage"]
+
+class _ColumnarPortfolio:
+    """
+    Stockage en colonnes (un DataFrame) d'une liste de dataclasses
+    
+    Les calculs Pilier 1 travaillent sur des colonnes contiguës plutôt que sur
+    un objet Python par ligne.
+    """
+    record_type = None
+    float_columns: Tuple[str, ...] = ()
+    # Colonne -> catégories connues ; les autres valeurs sont ajoutées à la suite
+    category_columns: Dict[str, Tuple[str, ...]] = {}
+    
+    def __init__(self, df: pd.DataFrame):
+        df = df.astype({column: np.float64 for column in self.float_columns})
+        for column, known in self.category_columns.items():
+            values = df[column]
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                extra = values[~values.isin(known)].dropna().unique().tolist()
+                df[column] = pd.Categorical(values, categories=[*known, *extra])
+        self.df = df
+    
+    @classmethod
+    def from_exposures(cls, records: List) -> "_ColumnarPortfolio":
+        """Construit le portefeuille à partir des dataclasses (compatibilité)"""
+        names = [field.name for field in fields(cls.record_type)]
+        return cls(pd.DataFrame({name: [getattr(record, name) for record in records] for name in names}))
+    
+    def __len__(self) -> int:
+        return len(self.df)
+
+class CreditPortfolio(_ColumnarPortfolio):
+    """Portefeuille d'expositions crédit en colonnes"""
+    record_type = CreditExposure
+    float_columns = ("amount", "lgd", "pd")
+    category_columns = {
+        "rating": RATING_CATEGORIES,
+        "counterparty_type": RISK_WEIGHT_COUNTERPARTY_TYPES,
+        "segment": ()
+    }
+
+class MarketPortfolio(_ColumnarPortfolio):
+    """Positions de marché en colonnes"""
+    record_type = MarketExposure
+    float_columns = ("notional", "maturity", "delta", "gamma", "vega", "theta")
+
+class OperationalPortfolio(_ColumnarPortfolio):
+    """Lignes métier du risque opérationnel en colonnes"""
+    record_type = OperationalRisk
+    float_columns = ("gross_income", "beta_factor")
+
 class Pillar1Calculator:
     """Calculateur principal pour les exigences Pilier 1"""
     
@@ -64,6 +189,7 @@ class Pillar1Calculator:
             config_path: Chemin vers le fichier de configuration JSON
         """
         self.config = self._load_config(config_path)
+        self._build_risk_weight_tables()
         self.credit_rwa = 0.0
         self.market_rwa = 0.0
         self.operational_rwa = 0.0
@@ -72,8 +198,8 @@ class Pillar1Calculator:
         """Charge la configuration depuis un fichier JSON"""
         if config_path:
             try:
-                with open(config_path, 'r') as f:
-                    return json.load(f)
+                config_path = os.path.realpath(config_path)
+                return _read_config(config_path, os.path.getmtime(config_path))
             except FileNotFoundError:
                 logger.warning(f"Fichier de configuration non trouvé: {config_path}")
         
@@ -96,97 +222,113 @@ class Pillar1Calculator:
             }
         }
     
-    def calculate_credit_rwa(self, exposures: List[CreditExposure]) -> Dict:
+    def calculate_credit_rwa(self, exposures: Union[List[CreditExposure], CreditPortfolio]) -> Dict:
         """
         Calcule les RWA pour le risque de crédit
         
         Args:
-            exposures: Liste des expositions au crédit
+            exposures: Liste des expositions au crédit, ou portefeuille en colonnes
             
         Returns:
             Dictionnaire avec le détail des RWA crédit
         """
         logger.info(f"Calcul des RWA crédit pour {len(exposures)} expositions")
         
-        total_rwa = 0.0
-        rwa_by_segment = {}
-        rwa_by_rating = {}
+        if not exposures:
+            self.credit_rwa = 0.0
+            return {
+                "total_rwa": 0.0,
+                "rwa_by_segment": {},
+                "rwa_by_rating": {},
+                "average_risk_weight": 0,
+                "number_exposures": 0
+            }
         
-        for exposure in exposures:
-            # Calcul du poids de risque selon l'approche standard
-            risk_weight = self._get_risk_weight(exposure)
-            
-            # Calcul du RWA pour cette exposition
-            exposure_rwa = exposure.amount * risk_weight
-            total_rwa += exposure_rwa
-            
-            # Agrégation par segment
-            if exposure.segment not in rwa_by_segment:
-                rwa_by_segment[exposure.segment] = 0.0
-            rwa_by_segment[exposure.segment] += exposure_rwa
-            
-            # Agrégation par notation
-            if exposure.rating not in rwa_by_rating:
-                rwa_by_rating[exposure.rating] = 0.0
-            rwa_by_rating[exposure.rating] += exposure_rwa
+        # Calcul en colonnes sur l'ensemble du portefeuille
+        if not isinstance(exposures, CreditPortfolio):
+            exposures = CreditPortfolio.from_exposures(exposures)
+        df = exposures.df
+        amount = df["amount"].to_numpy()
+        columns = pd.DataFrame({"amount": amount, "rwa": amount * self._get_risk_weights(df)}, index=df.index)
         
+        # Montant et RWA par segment en une passe ; les totaux s'en déduisent
+        # sur quelques lignes sans rescanner les colonnes (dropna=False : aucune
+        # exposition n'est exclue, segment ou notation absents comptent sous None)
+        by_segment = columns.groupby(df["segment"], sort=False, observed=True, dropna=False).sum()
+        total_amount, total_rwa = by_segment.sum().tolist()
         self.credit_rwa = total_rwa
         
         return {
             "total_rwa": total_rwa,
-            "rwa_by_segment": rwa_by_segment,
-            "rwa_by_rating": rwa_by_rating,
-            "average_risk_weight": total_rwa / sum(exp.amount for exp in exposures) if exposures else 0,
+            "rwa_by_segment": _totals_by_key(by_segment["rwa"]),
+            "rwa_by_rating": _totals_by_key(
+                columns["rwa"].groupby(df["rating"], sort=False, observed=True, dropna=False).sum()
+            ),
+            "average_risk_weight": total_rwa / total_amount,
             "number_exposures": len(exposures)
         }
     
+    def _build_risk_weight_tables(self):
+        """Récupère les tables de poids de risque figées de la configuration (voir _risk_weight_tables)"""
+        (self._rw_ratings, self._rw_lut,
+         self._rw_table, self._rw_mortgage_weight) = _risk_weight_tables(json.dumps(self.config["risk_weights"]))
+    
+    def _get_risk_weights(self, df: pd.DataFrame) -> np.ndarray:
+        """Poids de risque de toutes les expositions, même logique que _get_risk_weight"""
+        counterparty_codes, counterparty_positions = _category_codes(
+            df["counterparty_type"], RISK_WEIGHT_COUNTERPARTY_TYPES
+        )
+        rating_codes, rating_positions = _category_codes(df["rating"], self._rw_ratings)
+        
+        # Poids par (code contrepartie, code notation) de la colonne : petite table
+        # réalignée une fois, puis un seul gather par ligne sur les codes bruts.
+        # Les codes -1 tombent sur la dernière ligne/colonne, celle du poids par défaut.
+        weights_by_code = self._rw_table[np.ix_(counterparty_positions, rating_positions)]
+        weights = weights_by_code[counterparty_codes, rating_codes]
+        
+        is_retail = counterparty_positions == RISK_WEIGHT_COUNTERPARTY_TYPES.index("RETAIL")
+        mortgage = is_retail[counterparty_codes] & (df["product_type"].to_numpy() == "PRET_IMMOBILIER")
+        weights[mortgage] = self._rw_mortgage_weight
+        return weights
+    
     def _get_risk_weight(self, exposure: CreditExposure) -> float:
         """Détermine le poids de risque pour une exposition donnée"""
         
         # Logique simplifiée pour l'approche standard
-        if exposure.counterparty_type == "SOVEREIGN":
-            return self.config["risk_weights"]["sovereign"].get(exposure.rating, 1.0)
-        elif exposure.counterparty_type == "CORPORATE":
-            return self.config["risk_weights"]["corporate"].get(exposure.rating, 1.0)
-        elif exposure.counterparty_type == "RETAIL":
-            if exposure.product_type == "PRET_IMMOBILIER":
-                return self.config["risk_weights"]["retail"]["mortgage"]
-            else:
-                return self.config["risk_weights"]["retail"]["standard"]
-        else:
-            return 1.0  # Poids par défaut
+        if exposure.counterparty_type == "RETAIL":
+            product = "PRET_IMMOBILIER" if exposure.product_type == "PRET_IMMOBILIER" else None
+            return self._rw_lut[("RETAIL", None, product)]
+        return self._rw_lut.get((exposure.counterparty_type, exposure.rating, None), 1.0)  # Poids par défaut
     
-    def calculate_market_rwa(self, positions: List[MarketExposure]) -> Dict:
+    def calculate_market_rwa(self, positions: Union[List[MarketExposure], MarketPortfolio]) -> Dict:
         """
         Calcule les RWA pour le risque de marché (approche standard)
         
         Args:
-            positions: Liste des positions de marché
+            positions: Liste des positions de marché, ou positions en colonnes
             
         Returns:
             Dictionnaire avec le détail des RWA marché
         """
         logger.info(f"Calcul des RWA marché pour {len(positions)} positions")
         
-        # Calcul simplifié du risque de marché
-        interest_rate_risk = 0.0
-        equity_risk = 0.0
-        fx_risk = 0.0
-        commodity_risk = 0.0
+        # Calcul simplifié du risque de marché, en une passe sur les colonnes
+        if not isinstance(positions, MarketPortfolio):
+            positions = MarketPortfolio.from_exposures(positions)
+        df = positions.df
+        instrument_type = df["instrument_type"].to_numpy()
+        delta = df["delta"].to_numpy()
+        notional = df["notional"].to_numpy()
+        
+        contribution = np.abs(delta) * notional
+        ir_mask = np.isin(instrument_type, ["BOND", "IRS", "FRA"])
+        eq_mask = np.isin(instrument_type, ["EQUITY", "EQUITY_OPTION"])
+        fx_mask = np.isin(instrument_type, ["FX_FORWARD", "FX_OPTION"])
         
-        for position in positions:
-            if position.instrument_type in ["BOND", "IRS", "FRA"]:
-                # Risque de taux d'intérêt
-                duration_risk = abs(position.delta) * position.notional * 0.01  # 1% de choc
-                interest_rate_risk += duration_risk
-                
-            elif position.instrument_type in ["EQUITY", "EQUITY_OPTION"]:
-                # Risque actions
-                equity_risk += abs(position.delta) * position.notional * 0.08  # 8% de choc
-                
-            elif position.instrument_type in ["FX_FORWARD", "FX_OPTION"]:
-                # Risque de change
-                fx_risk += abs(position.delta) * position.notional * 0.08  # 8% de choc
+        interest_rate_risk = float(contribution[ir_mask].sum()) * 0.01  # Risque de taux : 1% de choc
+        equity_risk = float(contribution[eq_mask].sum()) * 0.08  # Risque actions : 8% de choc
+        fx_risk = float(contribution[fx_mask].sum()) * 0.08  # Risque de change : 8% de choc
+        commodity_risk = 0.0
         
         total_market_rwa = (interest_rate_risk + equity_risk + fx_risk + commodity_risk) * 12.5
         self.market_rwa = total_market_rwa
@@ -200,19 +342,25 @@ class Pillar1Calculator:
             "number_positions": len(positions)
         }
     
-    def calculate_operational_rwa(self, business_lines: List[OperationalRisk]) -> Dict:
+    def calculate_operational_rwa(self, business_lines: Union[List[OperationalRisk], OperationalPortfolio]) -> Dict:
         """
         Calcule les RWA pour le risque opérationnel (approche indicateur de base)
         
         Args:
-            business_lines: Liste des lignes métier avec revenus bruts
+            business_lines: Liste des lignes métier avec revenus bruts, ou lignes en colonnes
             
         Returns:
             Dictionnaire avec le détail des RWA opérationnels
         """
         logger.info(f"Calcul des RWA opérationnels pour {len(business_lines)} lignes métier")
         
-        total_gross_income = sum(bl.gross_income for bl in business_lines)
+        if not isinstance(business_lines, OperationalPortfolio):
+            business_lines = OperationalPortfolio.from_exposures(business_lines)
+        df = business_lines.df
+        gross_income = df["gross_income"].to_numpy()
+        beta_factor = df["beta_factor"].to_numpy()
+        
+        total_gross_income = float(gross_income.sum())
         
         # Approche indicateur de base: 15% des revenus bruts moyens sur 3 ans
         operational_capital = total_gross_income * 0.15
@@ -220,10 +368,8 @@ class Pillar1Calculator:
         
         self.operational_rwa = operational_rwa
         
-        rwa_by_business_line = {}
-        for bl in business_lines:
-            bl_rwa = bl.gross_income * bl.beta_factor * 12.5
-            rwa_by_business_line[bl.business_line] = bl_rwa
+        bl_rwa = gross_income * beta_factor * 12.5
+        rwa_by_business_line = dict(zip(df["business_line"].tolist(), bl_rwa.tolist()))
         
         return {
             "total_rwa": operational_rwa,
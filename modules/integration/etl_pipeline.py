@@ -372,15 +372,12 @@ class ETLPipeline:
         
         if enrichment_type == "risk_category":
             # Calcul de catégorie de risque basé sur le score et les jours d'impayé
-            def calculate_risk_category(row):
-                if row['JOURS_IMPAYE'] > 90:
-                    return 'HIGH'
-                elif row['JOURS_IMPAYE'] > 30 or row['SCORE'] < 500:
-                    return 'MEDIUM'
-                else:
-                    return 'LOW'
-            
-            data['RISK_CATEGORY'] = data.apply(calculate_risk_category, axis=1)
+            jours_impaye = data['JOURS_IMPAYE']
+            data['RISK_CATEGORY'] = np.select(
+                [jours_impaye > 90, (jours_impaye > 30) | (data['SCORE'] < 500)],
+                ['HIGH', 'MEDIUM'],
+                default='LOW'
+            )
         
         elif enrichment_type == "ltv_calculation":
             # Calcul du Loan-to-Value pour les prêts immobiliers
@@ -395,22 +392,22 @@ class ETLPipeline:
         """Applique le calcul de stage IFRS 9"""
         # Implémentation des règles de staging basées sur RISK_STAGING
         
-        def calculate_stage(row):
-            # Stage 3: Défaut (> 90 jours d'impayé)
-            if row['JOURS_IMPAYE'] >= 90:
-                return 3
-            
-            # Stage 2: Dégradation significative
-            if (row['JOURS_IMPAYE'] >= 30 or 
-                row['FLAG_RESTRUCTURE'] or 
-                row['FLAG_WATCH_LIST'] or
-                (row['TYPE_PRODUIT'] == 'PRET_IMMOBILIER' and row.get('LTV', 0) > 0.85)):
-                return 2
-            
-            # Stage 1: Performing
-            return 1
+        jours_impaye = data['JOURS_IMPAYE']
+        ltv = data['LTV'] if 'LTV' in data.columns else 0
+        
+        # Stage 3: Défaut (> 90 jours d'impayé)
+        stage_3 = jours_impaye >= 90
+        
+        # Stage 2: Dégradation significative
+        stage_2 = (
+            (jours_impaye >= 30) |
+            data['FLAG_RESTRUCTURE'].astype(bool) |
+            data['FLAG_WATCH_LIST'].astype(bool) |
+            ((data['TYPE_PRODUIT'] == 'PRET_IMMOBILIER') & (ltv > 0.85))
+        )
         
-        data['STAGE_CALCULATED'] = data.apply(calculate_stage, axis=1)
+        # Stage 1: Performing
+        data['STAGE_CALCULATED'] = np.select([stage_3, stage_2], [3, 2], default=1)
         
         # Comparaison avec le stage actuel pour détecter les changements
         data['STAGE_CHANGE'] = data['STAGE_CALCULATED'] != data['STAGE_ACTUEL']
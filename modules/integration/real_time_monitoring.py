@@ -522,11 +522,15 @@ class RealTimeMonitor:
         
         # Statistiques des alertes
         total_alerts = len(self.alerts)
-        active_alerts = len([a for a in self.alerts.values() if not a.resolved])
-        critical_alerts = len([a for a in self.alerts.values() if not a.resolved and a.severity == "Critical"])
+        active_alerts = critical_alerts = 0
+        for alert in self.alerts.values():
+            if not alert.resolved:
+                active_alerts += 1
+                if alert.severity == "Critical":
+                    critical_alerts += 1
         
         # Statistiques des flux de données
-        healthy_streams = len([s for s in self.data_streams.values() if s.status == "Healthy"])
+        healthy_streams = sum(1 for s in self.data_streams.values() if s.status == "Healthy")
         total_streams = len(self.data_streams)
         
         # Métriques système récentes
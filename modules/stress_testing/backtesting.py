@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, date
 import json
 import logging
+from collections import Counter
 from scipy import stats
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 import matplotlib.pyplot as plt
@@ -418,12 +419,14 @@ class BacktestingEngine:
         # Statistiques des backtests
         backtest_stats = {}
         if self.backtest_results:
-            passed_tests = sum(1 for result in self.backtest_results.values() if result.validation_status == "Pass")
+            results = self.backtest_results.values()
+            passed_tests = sum(1 for result in results if result.validation_status == "Pass")
             total_tests = len(self.backtest_results)
             
-            avg_r2 = np.mean([result.r2_score for result in self.backtest_results.values()])
-            avg_mae = np.mean([result.mae for result in self.backtest_results.values()])
-            avg_directional_accuracy = np.mean([result.directional_accuracy for result in self.backtest_results.values()])
+            # Moyennes des trois métriques en une seule réduction (colonnes r2, mae, précision directionnelle)
+            avg_r2, avg_mae, avg_directional_accuracy = np.array([
+                (result.r2_score, result.mae, result.directional_accuracy) for result in results
+            ]).mean(axis=0)
             
             backtest_stats = {
                 "total_tests": total_tests,
@@ -437,8 +440,7 @@ class BacktestingEngine:
         # Statistiques des validations de modèles
         model_validation_stats = {}
         if self.model_validations:
-            ratings = [validation.overall_rating for validation in self.model_validations.values()]
-            rating_counts = {rating: ratings.count(rating) for rating in set(ratings)}
+            rating_counts = dict(Counter(validation.overall_rating for validation in self.model_validations.values()))
             
             avg_accuracy = np.mean([
                 validation.performance_metrics.get("accuracy", 0) 
@@ -451,21 +453,11 @@ class BacktestingEngine:
                 "average_accuracy": avg_accuracy
             }
         
-        # Recommandations prioritaires
-        all_recommendations = []
-        for validation in self.model_validations.values():
-            all_recommendations.extend(validation.recommendations)
-        
-        # Comptage des recommandations les plus fréquentes
-        recommendation_counts = {}
-        for rec in all_recommendations:
-            recommendation_counts[rec] = recommendation_counts.get(rec, 0) + 1
-        
-        top_recommendations = sorted(
-            recommendation_counts.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:5]
+        # Recommandations prioritaires : les plus fréquentes sur l'ensemble des validations
+        recommendation_counts = Counter(
+            rec for validation in self.model_validations.values() for rec in validation.recommendations
+        )
+        top_recommendations = recommendation_counts.most_common(5)
         
         return {
             "report_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
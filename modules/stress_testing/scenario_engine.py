@@ -48,6 +48,35 @@ class StressResult:
     impact_percentage: float
     time_horizon: int
 
+def simulate_macro_paths(baseline: float, min_val: float, max_val: float,
+                         shocks: np.ndarray, mean_reversion: float = 0.3) -> np.ndarray:
+    """
+    Trajectoires à retour à la moyenne d'une variable macro, toutes simulations à la fois
+    
+    Args:
+        baseline: Niveau de long terme de la variable
+        min_val: Borne basse
+        max_val: Borne haute
+        shocks: Chocs pré-tirés, forme (num_simulations, horizon_years)
+        mean_reversion: Force de rappel vers le baseline
+        
+    Returns:
+        Trajectoires bornées, même forme que shocks
+    """
+    paths = np.empty_like(shocks)
+    value = np.clip(baseline + shocks[:, 0], min_val, max_val)
+    paths[:, 0] = value
+    for year in range(1, shocks.shape[1]):
+        value = np.clip(value + mean_reversion * (baseline - value) + shocks[:, year], min_val, max_val)
+        paths[:, year] = value
+    return paths
+
+def draw_macro_shocks(num_simulations: int, horizon_years: int) -> np.ndarray:
+    """Tire les chocs gaussiens : écart-type 1 la première année, 0.8 ensuite"""
+    shocks = np.random.normal(0.0, 1.0, size=(num_simulations, horizon_years))
+    shocks[:, 1:] *= 0.8
+    return shocks
+
 class ScenarioEngine:
     """Moteur principal de génération et application des scénarios"""
     
@@ -327,19 +356,15 @@ class ScenarioEngine:
         
         results = {}
         
+        # Variables de la première année du scénario ; une série vide est ignorée
+        # et la formule qui la lit retombe sur sa valeur par défaut
+        first_year = {var_name: values[0] for var_name, values in scenario.variables.items() if len(values)}
+        
         # Application aux différentes métriques
         for metric_name, baseline_value in portfolio_data.items():
-            if metric_name in ["cet1_ratio", "tier1_ratio", "total_ratio"]:
-                stressed_value = self._stress_capital_ratio(scenario, metric_name, baseline_value, portfolio_data)
-            elif metric_name in ["lcr", "nsfr"]:
-                stressed_value = self._stress_liquidity_ratio(scenario, metric_name, baseline_value, portfolio_data)
-            elif metric_name in ["roe", "roa", "nim"]:
-                stressed_value = self._stress_profitability_metric(scenario, metric_name, baseline_value, portfolio_data)
-            elif metric_name == "cost_of_risk":
-                stressed_value = self._stress_cost_of_risk(scenario, baseline_value, portfolio_data)
-            else:
-                # Métrique générique
-                stressed_value = self._apply_generic_stress(scenario, metric_name, baseline_value)
+            stressed_value = float(self._stress_metric(
+                metric_name, baseline_value, first_year, scenario.scenario_type, portfolio_data
+            ))
             
             impact = stressed_value - baseline_value
             impact_percentage = (impact / baseline_value * 100) if baseline_value != 0 else 0
@@ -358,22 +383,41 @@ class ScenarioEngine:
         
         return results
     
-    def _stress_capital_ratio(self, scenario: MacroScenario, metric_name: str, baseline_value: float, portfolio_data: Dict) -> float:
+    def _stress_metric(self, metric_name: str, baseline_value: float, first_year: Dict,
+                       scenario_type: str, portfolio_data: Dict):
+        """
+        Valeur stressée d'une métrique à partir des variables de la première année
+        
+        Les variables peuvent être des scalaires (un scénario) ou des tableaux
+        (une valeur par simulation Monte Carlo) : les formules sont vectorisées.
+        """
+        if metric_name in ["cet1_ratio", "tier1_ratio", "total_ratio"]:
+            return self._stress_capital_ratio(first_year, portfolio_data)
+        elif metric_name in ["lcr", "nsfr"]:
+            return self._stress_liquidity_ratio(first_year, baseline_value)
+        elif metric_name in ["roe", "roa", "nim"]:
+            return self._stress_profitability_metric(first_year, metric_name, baseline_value)
+        elif metric_name == "cost_of_risk":
+            return self._stress_cost_of_risk(first_year, baseline_value)
+        else:
+            # Métrique générique
+            return self._apply_generic_stress(scenario_type, baseline_value)
+    
+    def _stress_capital_ratio(self, first_year: Dict, portfolio_data: Dict):
         """Applique le stress aux ratios de capital"""
         
         # Récupération des variables du scénario (année 1)
-        gdp_growth = scenario.variables.get("gdp_growth", [0])[0]
-        unemployment_rate = scenario.variables.get("unemployment_rate", [7.5])[0]
-        house_price_growth = scenario.variables.get("house_price_growth", [0])[0]
+        gdp_growth = np.asarray(first_year.get("gdp_growth", 0))
+        unemployment_rate = np.asarray(first_year.get("unemployment_rate", 7.5))
+        house_price_growth = np.asarray(first_year.get("house_price_growth", 0))
         
         # Impact sur les pertes de crédit
-        credit_loss_multiplier = 1.0
-        if gdp_growth < -2.0:
-            credit_loss_multiplier += abs(gdp_growth) * 0.3
-        if unemployment_rate > 10.0:
-            credit_loss_multiplier += (unemployment_rate - 10.0) * 0.2
-        if house_price_growth < -10.0:
-            credit_loss_multiplier += abs(house_price_growth) * 0.1
+        credit_loss_multiplier = (
+            1.0
+            + np.where(gdp_growth < -2.0, np.abs(gdp_growth) * 0.3, 0.0)
+            + np.where(unemployment_rate > 10.0, (unemployment_rate - 10.0) * 0.2, 0.0)
+            + np.where(house_price_growth < -10.0, np.abs(house_price_growth) * 0.1, 0.0)
+        )
         
         # Impact sur le capital (pertes supplémentaires)
         baseline_capital = portfolio_data.get("tier1_capital", 1000000000)
@@ -385,84 +429,69 @@ class ScenarioEngine:
         # Calcul du ratio stressé
         stressed_ratio = (stressed_capital / baseline_rwa) * 100
         
-        return max(stressed_ratio, 0.0)  # Plancher à 0%
+        return np.maximum(stressed_ratio, 0.0)  # Plancher à 0%
     
-    def _stress_liquidity_ratio(self, scenario: MacroScenario, metric_name: str, baseline_value: float, portfolio_data: Dict) -> float:
+    def _stress_liquidity_ratio(self, first_year: Dict, baseline_value: float):
         """Applique le stress aux ratios de liquidité"""
         
         # Variables du scénario
-        gdp_growth = scenario.variables.get("gdp_growth", [0])[0]
-        corporate_bond_spread = scenario.variables.get("corporate_bond_spread", [150])[0]
-        
-        # Impact sur la liquidité
-        liquidity_stress_factor = 1.0
-        
-        if gdp_growth < -2.0:
-            liquidity_stress_factor -= abs(gdp_growth) * 0.05  # Dégradation liquidité
-        
-        if corporate_bond_spread > 300:
-            liquidity_stress_factor -= (corporate_bond_spread - 300) / 1000  # Impact spread
+        gdp_growth = np.asarray(first_year.get("gdp_growth", 0))
+        corporate_bond_spread = np.asarray(first_year.get("corporate_bond_spread", 150))
+        
+        # Impact sur la liquidité : dégradation liquidité et impact spread
+        liquidity_stress_factor = (
+            1.0
+            - np.where(gdp_growth < -2.0, np.abs(gdp_growth) * 0.05, 0.0)
+            - np.where(corporate_bond_spread > 300, (corporate_bond_spread - 300) / 1000, 0.0)
+        )
         
         stressed_value = baseline_value * liquidity_stress_factor
         
-        return max(stressed_value, 50.0)  # Plancher à 50%
+        return np.maximum(stressed_value, 50.0)  # Plancher à 50%
     
-    def _stress_profitability_metric(self, scenario: MacroScenario, metric_name: str, baseline_value: float, portfolio_data: Dict) -> float:
+    def _stress_profitability_metric(self, first_year: Dict, metric_name: str, baseline_value: float):
         """Applique le stress aux métriques de rentabilité"""
         
-        gdp_growth = scenario.variables.get("gdp_growth", [0])[0]
-        short_term_rate = scenario.variables.get("short_term_rate", [3.5])[0]
-        
-        # Impact sur la rentabilité
-        profitability_factor = 1.0
-        
-        # Impact croissance économique
-        profitability_factor += gdp_growth * 0.2
+        gdp_growth = np.asarray(first_year.get("gdp_growth", 0))
+        short_term_rate = np.asarray(first_year.get("short_term_rate", 3.5))
         
         # Impact taux d'intérêt (positif pour NIM, mixte pour ROE/ROA)
-        if metric_name == "nim":
-            profitability_factor += (short_term_rate - 3.5) * 0.1
-        else:
-            profitability_factor += (short_term_rate - 3.5) * 0.05
+        rate_sensitivity = 0.1 if metric_name == "nim" else 0.05
+        
+        # Impact croissance économique puis impact taux
+        profitability_factor = 1.0 + gdp_growth * 0.2 + (short_term_rate - 3.5) * rate_sensitivity
         
         stressed_value = baseline_value * profitability_factor
         
-        return max(stressed_value, 0.0)
+        return np.maximum(stressed_value, 0.0)
     
-    def _stress_cost_of_risk(self, scenario: MacroScenario, baseline_value: float, portfolio_data: Dict) -> float:
+    def _stress_cost_of_risk(self, first_year: Dict, baseline_value: float):
         """Applique le stress au coût du risque"""
         
-        gdp_growth = scenario.variables.get("gdp_growth", [0])[0]
-        unemployment_rate = scenario.variables.get("unemployment_rate", [7.5])[0]
-        house_price_growth = scenario.variables.get("house_price_growth", [0])[0]
-        
-        # Modèle simplifié de coût du risque
-        stress_multiplier = 1.0
-        
-        # Impact PIB
-        if gdp_growth < 0:
-            stress_multiplier += abs(gdp_growth) * 0.5
-        
-        # Impact chômage
-        if unemployment_rate > 8.0:
-            stress_multiplier += (unemployment_rate - 8.0) * 0.3
+        gdp_growth = np.asarray(first_year.get("gdp_growth", 0))
+        unemployment_rate = np.asarray(first_year.get("unemployment_rate", 7.5))
+        house_price_growth = np.asarray(first_year.get("house_price_growth", 0))
         
-        # Impact immobilier
-        if house_price_growth < -5.0:
-            stress_multiplier += abs(house_price_growth) * 0.02
+        # Modèle simplifié de coût du risque : impacts PIB, chômage et immobilier
+        stress_multiplier = (
+            1.0
+            + np.where(gdp_growth < 0, np.abs(gdp_growth) * 0.5, 0.0)
+            + np.where(unemployment_rate > 8.0, (unemployment_rate - 8.0) * 0.3, 0.0)
+            + np.where(house_price_growth < -5.0, np.abs(house_price_growth) * 0.02, 0.0)
+        )
         
         stressed_value = baseline_value * stress_multiplier
         
-        return min(stressed_value, baseline_value * 5.0)  # Plafond à 5x le baseline
+        return np.minimum(stressed_value, baseline_value * 5.0)  # Plafond à 5x le baseline
     
-    def _apply_generic_stress(self, scenario: MacroScenario, metric_name: str, baseline_value: float) -> float:
+    def _apply_generic_stress(self, scenario_type: str, baseline_value: float) -> float:
         """Applique un stress générique basé sur le type de scénario"""
         
-        if scenario.scenario_type == "Base":
+        if scenario_type == "Base":
             return baseline_value
-        elif scenario.scenario_type == "Adverse":
+        elif scenario_type == "Adverse":
             return baseline_value * 0.9  # Dégradation de 10%
-        elif scenario.scenario_type == "Severely_Adverse":
+        elif scenario_type == "Severely_Adverse":
             return baseline_value * 0.8  # Dégradation de 20%
         else:
             return baseline_value * 0.95  # Dégradation de 5% par défaut
@@ -480,27 +509,9 @@ class ScenarioEngine:
         """
         logger.info(f"Lancement simulation Monte Carlo: {num_simulations} simulations sur {horizon_years} ans")
         
-        # Génération des scénarios aléatoires
-        simulated_scenarios = []
-        
-        for i in range(num_simulations):
-            # Génération de variables corrélées
-            scenario_vars = self._generate_correlated_variables(horizon_years)
-            
-            scenario = MacroScenario(
-                scenario_id=f"MC_{i:05d}",
-                scenario_name=f"Monte Carlo Simulation {i+1}",
-                scenario_type="Monte_Carlo",
-                horizon_years=horizon_years,
-                variables=scenario_vars,
-                probability=1.0/num_simulations,
-                source="Monte_Carlo"
-            )
-            
-            simulated_scenarios.append(scenario)
-        
-        # Calcul des statistiques
-        results_distribution = {}
+        # Génération vectorisée des trajectoires : une matrice (simulations, années) par variable
+        simulated_paths = self._simulate_variable_paths(num_simulations, horizon_years)
+        first_year = {var_name: paths[:, 0] for var_name, paths in simulated_paths.items()}
         
         # Portfolio de référence pour les simulations
         reference_portfolio = {
@@ -514,70 +525,46 @@ class ScenarioEngine:
             "total_rwa": 8000000000
         }
         
-        for scenario in simulated_scenarios[:100]:  # Limite pour l'exemple
-            scenario_results = self.apply_scenario_to_portfolio(scenario, reference_portfolio)
-            
-            for metric_name, result in scenario_results.items():
-                if metric_name not in results_distribution:
-                    results_distribution[metric_name] = []
-                results_distribution[metric_name].append(result.stressed_value)
-        
-        # Calcul des percentiles
+        # Stress appliqué à toutes les simulations d'un coup : un tableau par métrique
+        percentiles = (1, 5, 10, 50, 90, 95, 99)
         monte_carlo_stats = {}
-        for metric_name, values in results_distribution.items():
-            monte_carlo_stats[metric_name] = {
+        for metric_name, baseline_value in reference_portfolio.items():
+            values = np.broadcast_to(
+                self._stress_metric(metric_name, baseline_value, first_year, "Monte_Carlo", reference_portfolio),
+                (num_simulations,)
+            )
+            stats_values = {
                 "mean": np.mean(values),
                 "std": np.std(values),
                 "min": np.min(values),
-                "max": np.max(values),
-                "p1": np.percentile(values, 1),
-                "p5": np.percentile(values, 5),
-                "p10": np.percentile(values, 10),
-                "p50": np.percentile(values, 50),
-                "p90": np.percentile(values, 90),
-                "p95": np.percentile(values, 95),
-                "p99": np.percentile(values, 99)
+                "max": np.max(values)
             }
+            stats_values.update(zip((f"p{p}" for p in percentiles), np.percentile(values, percentiles)))
+            monte_carlo_stats[metric_name] = stats_values
         
         return {
-            "num_simulations": len(simulated_scenarios),
+            "num_simulations": num_simulations,
             "horizon_years": horizon_years,
             "statistics": monte_carlo_stats,
-            "scenarios_generated": len(simulated_scenarios)
+            "scenarios_generated": num_simulations
+        }
+    
+    def _simulate_variable_paths(self, num_simulations: int, horizon_years: int) -> Dict[str, np.ndarray]:
+        """Simule les trajectoires de chaque variable macro pour toutes les simulations"""
+        return {
+            var_name: simulate_macro_paths(
+                config["baseline"], config["min"], config["max"],
+                draw_macro_shocks(num_simulations, horizon_years)
+            )
+            for var_name, config in self.config["macro_variables"].items()
         }
     
     def _generate_correlated_variables(self, horizon_years: int) -> Dict[str, List[float]]:
         """Génère des variables macroéconomiques corrélées"""
-        
-        variables = {}
-        
-        # Génération de variables indépendantes puis application de corrélations
-        for var_name, config in self.config["macro_variables"].items():
-            baseline = config["baseline"]
-            min_val = config["min"]
-            max_val = config["max"]
-            
-            # Génération de valeurs aléatoires autour du baseline
-            values = []
-            for year in range(horizon_years):
-                # Marche aléatoire avec retour à la moyenne
-                if year == 0:
-                    shock = np.random.normal(0, 1.0)  # Écart-type de 1
-                    value = baseline + shock
-                else:
-                    # Retour à la moyenne avec persistance
-                    prev_value = values[year-1]
-                    mean_reversion = 0.3 * (baseline - prev_value)
-                    shock = np.random.normal(0, 0.8)
-                    value = prev_value + mean_reversion + shock
-                
-                # Contraintes min/max
-                value = max(min_val, min(max_val, value))
-                values.append(value)
-            
-            variables[var_name] = values
-        
-        return variables
+        return {
+            var_name: paths[0].tolist()
+            for var_name, paths in self._simulate_variable_paths(1, horizon_years).items()
+        }
 
 def create_sample_stress_data() -> Dict:
     """Crée des données d'exemple pour le stress testing"""
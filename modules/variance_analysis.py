@@ -72,10 +72,10 @@ def create_waterfall_chart(data: List[Dict], title: str, value_column: str = 'va
     
     # Calcul des variations
     dates = [d['date'] for d in data]
-    values = [d[value_column] for d in data]
+    values = np.array([d[value_column] for d in data], dtype=float)
     
     # Première valeur absolue, puis variations relatives
-    changes = [values[0]] + [values[i] - values[i-1] for i in range(1, len(values))]
+    changes = np.diff(values, prepend=0.0)
     measures = ["absolute"] + ["relative"] * (len(changes) - 1)
     
     fig = go.Figure()
@@ -86,7 +86,7 @@ def create_waterfall_chart(data: List[Dict], title: str, value_column: str = 'va
         measure=measures,
         x=dates,
         textposition="outside",
-        text=[f"{c:+.2f}" if c != changes[0] else f"{c:.2f}" for c in changes],
+        text=[f"{changes[0]:.2f}"] + [f"{c:+.2f}" for c in changes[1:]],
         y=changes,
         connector={"line": {"color": "rgb(63, 63, 63)"}},
         increasing={"marker": {"color": "#10b981"}},
@@ -525,7 +525,7 @@ def show_variance_analysis_dashboard():
     if selected_metric != "cost_of_risk":
         monthly_data = metric_data.get('monthly_36m', [])
         if monthly_data:
-            values = [d['value'] for d in monthly_data]
+            values = np.array([d['value'] for d in monthly_data], dtype=float)
             
             with col1:
                 st.metric("Moyenne 36M", f"{np.mean(values):.2f}%")
@@ -543,7 +543,7 @@ def show_variance_analysis_dashboard():
     else:  # Cost of Risk
         quarterly_data = metric_data.get('quarterly_36m', [])
         if quarterly_data:
-            values = [d['value'] for d in quarterly_data]
+            values = np.array([d['value'] for d in quarterly_data], dtype=float)
             
             with col1:
                 st.metric("Moyenne 36M", f"{np.mean(values):.2f}%")
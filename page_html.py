@@ -0,0 +1,174 @@
+"""
+Blocs HTML des pages du CRO Dashboard
+
+Module importé (et donc évalué) une seule fois par processus : app.py, script
+principal, est réexécuté à chaque rerun, les constantes n'y seraient pas figées.
+"""
+import textwrap
+from contextlib import contextmanager
+from typing import Final
+
+from ux_enhancements import status_message_html
+
+class HtmlBuffer:
+    """
+    Accumule des fragments HTML pour les émettre en un seul st.markdown
+
+    Chaque fragment est dédenté et débarrassé de ses lignes vides de bord :
+    st.markdown ne dédente que le corps entier, et un fragment indenté placé
+    après une ligne vide serait rendu comme un bloc de code Markdown.
+    """
+    
+    def __init__(self):
+        self._parts = []
+    
+    @staticmethod
+    def _normalize(html):
+        return textwrap.dedent(html).strip()
+    
+    def extend(self, fragments):
+        self._parts.extend(map(self._normalize, fragments))
+    
+    @contextmanager
+    def section(self, css_class="content-section fade-in"):
+        """Ouvre un <div> de section, refermé à la sortie du bloc"""
+        self._parts.append(f'<div class="{css_class}">')
+        yield self
+        self._parts.append('</div>')
+    
+    def render(self):
+        return "".join(self._parts)
+
+# Carte KPI : seules les valeurs changent d'un rendu à l'autre
+METRIC_TMPL = """
+<div class="metric-card metric-{status}" style="position: relative;">
+    <div class="status-badge {badge}">{badge_label}</div>
+    <h4 class="metric-label">{title}</h4>
+    <div class="metric-value">{value} <span class="trend-icon trend-{trend}">{trend_icon}</span></div>
+    <div class="metric-variation">{delta} vs mois précédent</div>
+</div>
+"""
+METRIC_BADGES = {"normal": "conforme", "warning": "surveillance", "critical": "alerte"}
+TREND_ICONS = {"up": "↗️", "down": "↘️", "stable": "➡️"}
+
+# (titre, valeur, statut, variation, tendance) des KPI de la Vue d'Ensemble
+OVERVIEW_METRICS = (
+    ("RATIO CET1", "5.8%", "warning", "-0.4%", "down"),
+    ("RATIO DE LIQUIDITÉ LCR", "108%", "warning", "-7%", "down"),
+    ("COÛT DU RISQUE", "0.45%", "normal", "+0.05%", "up"),
+    ("ROE", "12.3%", "normal", "+0.8%", "up"),
+)
+
+def render_metric_html(title, value, status, delta, trend):
+    """Construit le HTML d'une carte KPI avec badge de statut et tendance"""
+    badge = METRIC_BADGES[status]
+    return METRIC_TMPL.format(
+        status=status, badge=badge, badge_label=badge.upper(), title=title,
+        value=value, trend=trend, trend_icon=TREND_ICONS[trend], delta=delta
+    )
+
+def build_section_html(*fragments, css_class="content-section fade-in"):
+    """Assemble des fragments HTML dans un <div> de section"""
+    buf = HtmlBuffer()
+    with buf.section(css_class):
+        buf.extend(fragments)
+    return buf.render()
+
+# Blocs HTML statiques des pages, construits une seule fois à l'import du module
+OVERVIEW_KPI_HTML: Final[str] = build_section_html(
+    '<h2 class="section-title">📊 Indicateurs Clés de Performance</h2>',
+    # Métriques avec nouveau système d'alertes
+    build_section_html(*(render_metric_html(*metric) for metric in OVERVIEW_METRICS), css_class="kpi-grid"),
+    # Messages d'alerte basés sur les seuils réglementaires
+    build_section_html(
+        status_message_html(
+            "⚠️ ALERTE RÉGLEMENTAIRE : Ratio CET1 (5.8%) proche du seuil minimum réglementaire (4.5%). Action requise.", 
+            "warning"
+        ),
+        status_message_html(
+            "⚠️ SURVEILLANCE : Ratio LCR (108%) sous le seuil de confort (110%). Monitoring renforcé recommandé.", 
+            "warning"
+        ),
+        css_class="kpi-alerts"
+    ),
+)
+
+OVERVIEW_COMPLIANCE_HTML: Final[str] = build_section_html(
+    '<h2 class="section-title">Statut Conformité Réglementaire</h2>',
+    """
+    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem;">
+        <div style="text-align: center; padding: 1rem;">
+            <h3 style="color: var(--text-dark); margin-bottom: 0.5rem;">Pilier 1</h3>
+            <span class="status-badge compliant">Conforme</span>
+            <p style="color: var(--text-medium); font-size: 0.875rem; margin-top: 0.5rem;">
+                Exigences de fonds propres respectées
+            </p>
+        </div>
+        <div style="text-align: center; padding: 1rem;">
+            <h3 style="color: var(--text-dark); margin-bottom: 0.5rem;">Pilier 2</h3>
+            <span class="status-badge warning">Surveillance</span>
+            <p style="color: var(--text-medium); font-size: 0.875rem; margin-top: 0.5rem;">
+                ICAAP en cours de finalisation
+            </p>
+        </div>
+        <div style="text-align: center; padding: 1rem;">
+            <h3 style="color: var(--text-dark); margin-bottom: 0.5rem;">Pilier 3</h3>
+            <span class="status-badge compliant">Conforme</span>
+            <p style="color: var(--text-medium); font-size: 0.875rem; margin-top: 0.5rem;">
+                Publications à jour
+            </p>
+        </div>
+    </div>
+    """,
+)
+
+COMPLIANCE_PILLAR1_HTML: Final[str] = build_section_html(
+    '<h3>Exigences de Fonds Propres</h3>',
+    """
+    <div class="metrics-grid">
+        <div class="metric-card status-good">
+            <div class="metric-title">CET1 Ratio</div>
+            <div class="metric-value">14.2%</div>
+            <div class="metric-change positive">Minimum: 4.5%</div>
+        </div>
+        <div class="metric-card status-good">
+            <div class="metric-title">Tier 1 Ratio</div>
+            <div class="metric-value">15.1%</div>
+            <div class="metric-change positive">Minimum: 6.0%</div>
+        </div>
+        <div class="metric-card status-good">
+            <div class="metric-title">Total Capital Ratio</div>
+            <div class="metric-value">17.8%</div>
+            <div class="metric-change positive">Minimum: 8.0%</div>
+        </div>
+    </div>
+    """,
+    css_class="content-section"
+)
+
+COMPLIANCE_PILLAR2_HTML: Final[str] = build_section_html(
+    '<h3>Surveillance Prudentielle</h3>',
+    '<p>ICAAP (Internal Capital Adequacy Assessment Process) et ILAAP en cours.</p>',
+    css_class="content-section"
+)
+
+COMPLIANCE_PILLAR3_HTML: Final[str] = build_section_html(
+    '<h3>Discipline de Marché</h3>',
+    '<p>Publications réglementaires et transparence.</p>',
+    css_class="content-section"
+)
+
+STRESS_TESTING_HTML: Final[str] = build_section_html(
+    '<h3>Scénarios de Stress Testing</h3>',
+    '<p>Analyse des impacts des scénarios adverses sur les ratios de capital.</p>'
+)
+
+INTEGRATION_HTML: Final[str] = build_section_html(
+    '<h3>Monitoring Temps Réel</h3>',
+    '<p>Surveillance des flux de données et intégration des systèmes.</p>'
+)
+
+REPORTING_HTML: Final[str] = build_section_html(
+    '<h3>Templates Réglementaires</h3>',
+    '<p>COREP, FINREP, LCR et autres rapports automatisés.</p>'
+)
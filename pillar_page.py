@@ -6,12 +6,12 @@ import streamlit as st
 import sys
 import os
 
-from data_manager import DataManager
+from data_manager import get_data_manager
 
 def show_pillar_page(pillar_id):
     """Affiche la page d'un pilier spécifique du framework avec mise en page optimisée"""
     
-    data_manager = DataManager()
+    data_manager = get_data_manager()
     pillars_data = data_manager.get_all_pillars()
     
     # Mapping entre les IDs de navigation et les clés des données
@@ -143,7 +143,7 @@ def show_all_pillars_overview():
     
     st.markdown("## 🧭 Framework CRO - Vue d'Ensemble")
     
-    data_manager = DataManager()
+    data_manager = get_data_manager()
     pillars_data = data_manager.get_all_pillars()
     
     # Grille 3x2 pour afficher les 6 piliers de manière compacte
@@ -11,27 +11,31 @@ import pandas as pd
 import json
 import numpy as np
 from datetime import datetime, timedelta
-from data_manager import DataManager
+from utils.data_loader import load_json
+from ux_enhancements import WEBGL_MIN_POINTS
 from modules.performance_financiere import show_performance_financiere
 from modules.variance_analysis import show_variance_analysis_dashboard
 from modules.benchmarking_alerts import show_benchmarking_alerts_dashboard
 from pathlib import Path
 
+# Config Plotly des graphiques de séries temporelles
+TIME_SERIES_CONFIG = {"scrollZoom": True, "responsive": True}
+
+# Chemin absolu vers le fichier, peu importe d'où le script est lancé
+RISK_DASHBOARD_DATA_PATH = Path(__file__).resolve().parent / "risk_dashboard_data.json"
+
 def load_risk_dashboard_data():
-    """Charge les données du Dashboard Risques de manière robuste."""
+    """Charge les données du Dashboard Risques (parsées une fois par version du fichier)"""
     try:
-        # Construit un chemin absolu vers le fichier, peu importe d'où le script est lancé
-        base_dir = Path(__file__).resolve().parent
-        file_path = base_dir / "risk_dashboard_data.json"
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(str(RISK_DASHBOARD_DATA_PATH), RISK_DASHBOARD_DATA_PATH.stat().st_mtime)
     except FileNotFoundError:
+        # Hors du cache : le message s'affiche à chaque rendu et l'échec n'est pas mémorisé
         st.error(f"Fichier risk_dashboard_data.json non trouvé. Assurez-vous qu'il est à la racine de votre projet.")
         return {}
 
+@st.cache_data(show_spinner=False)
 def create_gauge_chart(value, title, min_val=0, max_val=100, thresholds=None):
-    """Crée un graphique en jauge"""
+    """Crée un graphique en jauge (dict Plotly, mis en cache)"""
     fig = go.Figure(go.Indicator(
         mode = "gauge+number+delta",
         value = value,
@@ -59,19 +63,21 @@ def create_gauge_chart(value, title, min_val=0, max_val=100, thresholds=None):
             fig.add_hline(y=threshold_value, line_dash="dash", line_color="red")
     
     fig.update_layout(height=300)
-    return fig
+    return fig.to_dict()
 
+@st.cache_data(show_spinner=False)
 def create_historical_line_chart(data, title, y_label, thresholds=None):
-    """Crée un graphique linéaire historique"""
+    """Crée un graphique linéaire historique (dict Plotly, mis en cache)"""
     if not data:
-        return go.Figure()
+        return go.Figure().to_dict()
     
     df = pd.DataFrame(data)
     
     fig = go.Figure()
     
-    # Ligne principale
-    fig.add_trace(go.Scatter(
+    # Ligne principale (WebGL pour les longues séries)
+    trace_type = go.Scattergl if len(df) > WEBGL_MIN_POINTS else go.Scatter
+    fig.add_trace(trace_type(
         x=df['date'],
         y=df['value'],
         mode='lines+markers',
@@ -98,12 +104,13 @@ def create_historical_line_chart(data, title, y_label, thresholds=None):
         showlegend=True
     )
     
-    return fig
+    return fig.to_dict()
 
+@st.cache_data(show_spinner=False)
 def create_donut_chart(data, title):
-    """Crée un graphique en donut"""
+    """Crée un graphique en donut (dict Plotly, mis en cache)"""
     if not data:
-        return go.Figure()
+        return go.Figure().to_dict()
     
     labels = list(data.keys())
     values = list(data.values())
@@ -123,7 +130,7 @@ def create_donut_chart(data, title):
         font=dict(size=12)
     )
     
-    return fig
+    return fig.to_dict()
 
 def show_capital_solvency_tab(risk_data):
     """Onglet A - Capital & Solvency"""
@@ -142,7 +149,7 @@ def show_capital_solvency_tab(risk_data):
         
         # Gauge CET1
         fig_cet1_gauge = create_gauge_chart(14.2, "CET1 Ratio (%)", 0, 20)
-        st.plotly_chart(fig_cet1_gauge, use_container_width=True)
+        st.plotly_chart(fig_cet1_gauge, use_container_width=True, key="cet1_gauge")
     
     with col2:
         # Solvency KPI Card + Gauge
@@ -155,7 +162,7 @@ def show_capital_solvency_tab(risk_data):
         
         # Gauge Solvency
         fig_solvency_gauge = create_gauge_chart(18.9, "Solvency Ratio (%)", 0, 25)
-        st.plotly_chart(fig_solvency_gauge, use_container_width=True)
+        st.plotly_chart(fig_solvency_gauge, use_container_width=True, key="solvency_gauge")
     
     st.markdown("---")
     
@@ -179,7 +186,7 @@ def show_capital_solvency_tab(risk_data):
                 "CET1 (%)",
                 thresholds
             )
-            st.plotly_chart(fig_cet1_hist, use_container_width=True)
+            st.plotly_chart(fig_cet1_hist, use_container_width=True, key="cet1_hist", config=TIME_SERIES_CONFIG)
     
     with col2:
         # Solvency Historique
@@ -195,7 +202,7 @@ def show_capital_solvency_tab(risk_data):
                 "Solvabilité (%)",
                 solvency_thresholds
             )
-            st.plotly_chart(fig_solvency_hist, use_container_width=True)
+            st.plotly_chart(fig_solvency_hist, use_container_width=True, key="solvency_hist", config=TIME_SERIES_CONFIG)
 
 def show_liquidity_tab(risk_data):
     """Onglet B - Liquidity"""
@@ -214,7 +221,7 @@ def show_liquidity_tab(risk_data):
         
         # Gauge LCR
         fig_lcr_gauge = create_gauge_chart(145.3, "LCR (%)", 0, 200)
-        st.plotly_chart(fig_lcr_gauge, use_container_width=True)
+        st.plotly_chart(fig_lcr_gauge, use_container_width=True, key="lcr_gauge")
     
     with col2:
         # NSFR KPI Card
@@ -227,7 +234,7 @@ def show_liquidity_tab(risk_data):
         
         # Gauge NSFR
         fig_nsfr_gauge = create_gauge_chart(118.7, "NSFR (%)", 0, 150)
-        st.plotly_chart(fig_nsfr_gauge, use_container_width=True)
+        st.plotly_chart(fig_nsfr_gauge, use_container_width=True, key="nsfr_gauge")
     
     st.markdown("---")
     
@@ -250,7 +257,7 @@ def show_liquidity_tab(risk_data):
                 "LCR (%)",
                 lcr_thresholds
             )
-            st.plotly_chart(fig_lcr_hist, use_container_width=True)
+            st.plotly_chart(fig_lcr_hist, use_container_width=True, key="lcr_hist", config=TIME_SERIES_CONFIG)
     
     with col2:
         # NSFR Historique
@@ -266,7 +273,7 @@ def show_liquidity_tab(risk_data):
                 "NSFR (%)",
                 nsfr_thresholds
             )
-            st.plotly_chart(fig_nsfr_hist, use_container_width=True)
+            st.plotly_chart(fig_nsfr_hist, use_container_width=True, key="nsfr_hist", config=TIME_SERIES_CONFIG)
 
 def show_credit_rwa_tab(risk_data):
     """Onglet C - Credit & RWA"""
@@ -292,7 +299,7 @@ def show_credit_rwa_tab(risk_data):
                 "Coût du Risque (%)",
                 {"Cible": 0.40}
             )
-            st.plotly_chart(fig_cor_hist, use_container_width=True)
+            st.plotly_chart(fig_cor_hist, use_container_width=True, key="cor_hist", config=TIME_SERIES_CONFIG)
     
     with col2:
         # RWA Total
@@ -307,7 +314,7 @@ def show_credit_rwa_tab(risk_data):
         rwa_breakdown = risk_data.get("rwa_breakdown", {})
         if rwa_breakdown:
             fig_rwa_donut = create_donut_chart(rwa_breakdown, "Répartition RWA par Type de Risque")
-            st.plotly_chart(fig_rwa_donut, use_container_width=True)
+            st.plotly_chart(fig_rwa_donut, use_container_width=True, key="rwa_donut")
     
     st.markdown("---")
     
@@ -321,14 +328,14 @@ def show_credit_rwa_tab(risk_data):
         exposure_retail = risk_data.get("exposures", {}).get("retail", {})
         if exposure_retail:
             fig_retail = create_donut_chart(exposure_retail, "Expositions Retail")
-            st.plotly_chart(fig_retail, use_container_width=True)
+            st.plotly_chart(fig_retail, use_container_width=True, key="credit_retail_chart")
     
     with col2:
         # Exposition Corporate
         exposure_corporate = risk_data.get("exposures", {}).get("corporate", {})
         if exposure_corporate:
             fig_corporate = create_donut_chart(exposure_corporate, "Expositions Corporate")
-            st.plotly_chart(fig_corporate, use_container_width=True)
+            st.plotly_chart(fig_corporate, use_container_width=True, key="credit_corporate_chart")
 
 def show_other_risks_tab():
     """Onglet D - Other Risks"""
@@ -407,7 +414,7 @@ def show_other_risks_tab():
     )
     
     fig_other.update_layout(height=400, showlegend=False)
-    st.plotly_chart(fig_other, use_container_width=True)
+    st.plotly_chart(fig_other, use_container_width=True, key="other_risks_chart")
 
 def show_heatmap_alerts_tab():
     """Onglet E - Heatmap & Alerts"""
@@ -446,7 +453,7 @@ def show_heatmap_alerts_tab():
         height=400
     )
     
-    st.plotly_chart(fig_heatmap, use_container_width=True)
+    st.plotly_chart(fig_heatmap, use_container_width=True, key="heatmap")
     
     st.markdown("---")
     
@@ -474,7 +481,7 @@ def show_heatmap_alerts_tab():
         }
         
         fig_alerts = create_donut_chart(alert_stats, "Répartition des Alertes")
-        st.plotly_chart(fig_alerts, use_container_width=True)
+        st.plotly_chart(fig_alerts, use_container_width=True, key="alerts_donut")
     
     st.markdown("---")
     
@@ -590,7 +597,7 @@ def show_credit_rwa_tab_enriched(risk_data):
             }
             
             fig_rwa_donut = create_donut_chart(rwa_by_type, "RWA par Type de Risque (M€)")
-            st.plotly_chart(fig_rwa_donut, use_container_width=True)
+            st.plotly_chart(fig_rwa_donut, use_container_width=True, key="rwa_donut_enriched")
     
     with col2:
         # Waterfall Chart Évolution RWA
@@ -621,7 +628,7 @@ def show_credit_rwa_tab_enriched(risk_data):
                 height=300
             )
             
-            st.plotly_chart(fig_waterfall, use_container_width=True)
+            st.plotly_chart(fig_waterfall, use_container_width=True, key="waterfall")
     
     st.markdown("---")
     
@@ -683,7 +690,7 @@ def show_credit_rwa_tab_enriched(risk_data):
                 showlegend=False
             )
             
-            st.plotly_chart(fig_portfolios, use_container_width=True)
+            st.plotly_chart(fig_portfolios, use_container_width=True, key="portfolios")
     
     st.markdown("---")
     
@@ -744,7 +751,7 @@ def show_credit_rwa_tab_enriched(risk_data):
             }
             
             fig_stages = create_donut_chart(stages_amounts, "Répartition par Stage IFRS 9 (M€)")
-            st.plotly_chart(fig_stages, use_container_width=True)
+            st.plotly_chart(fig_stages, use_container_width=True, key="stages")
     
     with col2:
         # Table détaillée IFRS 9
@@ -809,5 +816,5 @@ def show_credit_rwa_tab_enriched(risk_data):
             hovermode='x unified'
         )
         
-        st.plotly_chart(fig_cor_trend, use_container_width=True)
+        st.plotly_chart(fig_cor_trend, use_container_width=True, key="cor_trend")
 
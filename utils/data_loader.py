@@ -0,0 +1,65 @@
+"""
+Chargeurs partagés des fichiers JSON du CRO Dashboard
+
+load_json est le seul parseur JSON mis en cache de l'application (pages
+Actions, DataManager, benchmarking) : un fichier est parsé une seule fois par
+version (clé : chemin et date de modification) pour toutes les sessions.
+st.cache_data et non st.cache_resource : les appelants reçoivent chacun leur
+copie et peuvent la modifier sans toucher aux autres sessions. Les erreurs de
+lecture ne sont pas mises en cache et sont signalées à chaque accès.
+"""
+import os
+
+import orjson
+import streamlit as st
+
+ACTIONS_DATA_PATH = 'actions_dashboard_data.json'
+CHECKLIST_DATA_PATH = 'checklist_data.json'
+
+@st.cache_data(show_spinner=False)
+def load_json(path: str, mtime: float) -> dict:
+    """Parse un fichier JSON ; mtime invalide l'entrée quand le fichier change"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def get_actions(path: str = ACTIONS_DATA_PATH) -> dict:
+    """
+    Charge les données du Dashboard Actions
+
+    Args:
+        path: Chemin du fichier JSON
+
+    Returns:
+        dict: Données parsées, ou dictionnaire vide en cas d'erreur
+    """
+    try:
+        return load_json(path, os.path.getmtime(path))
+    except FileNotFoundError:
+        st.error("Fichier de données du Dashboard Actions non trouvé")
+        return {}
+    except orjson.JSONDecodeError:
+        st.error("Erreur de format dans le fichier JSON")
+        return {}
+
+def get_checklist(path: str = CHECKLIST_DATA_PATH) -> dict:
+    """
+    Charge les données de checklist
+
+    Args:
+        path: Chemin du fichier JSON
+
+    Returns:
+        dict: Données parsées, ou dictionnaire vide en cas d'erreur
+    """
+    try:
+        return load_json(path, os.path.getmtime(path))
+    except FileNotFoundError:
+        st.error(f"Fichier {path} non trouvé")
+        return {}
+    except orjson.JSONDecodeError:
+        st.error(f"Erreur de format dans {path}")
+        return {}
+
+def reload():
+    """Vide le cache pour relire les fichiers JSON au prochain accès"""
+    load_json.clear()
@@ -16,6 +16,9 @@ REGULATORY_THRESHOLDS = {
     'Total_Capital_Ratio': {'critical': 8.0, 'warning': 10.0, 'target': 12.0}
 }
 
+# Au-delà de ce nombre de points, les séries passent en WebGL (Scattergl)
+WEBGL_MIN_POINTS = 500
+
 def get_metric_status(metric_name: str, value: float) -> str:
     """
     Détermine le statut d'une métrique selon les seuils réglementaires
@@ -135,12 +138,11 @@ def show_status_message(message: str, status_type: str = "success") -> None:
         message: Message à afficher
         status_type: 'success', 'warning', ou 'error'
     """
-    message_html = f"""
-    <div class="status-message {status_type}">
-        {message}
-    </div>
-    """
-    st.markdown(message_html, unsafe_allow_html=True)
+    st.markdown(status_message_html(message, status_type), unsafe_allow_html=True)
+
+def status_message_html(message: str, status_type: str = "success") -> str:
+    """HTML d'un message d'état, sans indentation, pour l'insérer dans un bloc HTML plus large"""
+    return f'<div class="status-message {status_type}">{message}</div>'
 
 def simulate_loading(duration: float = 1.0) -> None:
     """